@@ -0,0 +1,54 @@
+from __future__ import annotations
+from typing import Callable, List
+
+import numpy as np
+from manim import *
+
+
+def map_family_points(function: Callable[[np.ndarray], np.ndarray], *mobjects: Mobject) -> None:
+    """
+    Stacks the points of the whole family of the mobjects into one (N, 3) array,
+    maps it by a single call of the function and writes the images back.
+    """
+    members = [member for mobject in mobjects for member in mobject.family_members_with_points()]
+    sizes = [len(member.points) for member in members]
+    points = np.concatenate([member.points for member in members] or [np.zeros((0, 3))])
+    images = np.asarray(function(points), dtype=float)
+    if images.shape != points.shape:
+        raise ValueError(f"{function} mapped {points.shape} points to {images.shape}")
+    for member, start, size in zip(members, np.cumsum([0] + sizes), sizes):
+        member.points = images[start:start + size]
+
+
+class ApplyPointsFunction(Transform):
+    def __init__(self, function: Callable[[np.ndarray], np.ndarray], mobject: Mobject, **kwargs) -> None:
+        """
+        ApplyPointwiseFunction for functions of point arrays. The points of the whole
+        family of the mobject are mapped by a single call, instead of calling the
+        function once per point. apply_points_function does the same for several mobjects.
+
+        :param function: takes an (N, 3) array of points and returns their (N, 3) images
+        :param mobject: the transformed mobject
+        :param kwargs: Transform kwargs
+        """
+        self.function = function
+        super(ApplyPointsFunction, self).__init__(mobject, **kwargs)
+
+    def create_target(self) -> Mobject:
+        target = self.mobject.copy()
+        map_family_points(self.function, target)
+        return target
+
+
+def apply_points_function(function: Callable[[np.ndarray], np.ndarray], *mobjects: Mobject,
+                          **kwargs) -> List[Transform]:
+    """
+    ApplyPointsFunction over several mobjects, e.g. a whole scene. Every mobject gets its
+    own Transform, so none is regrouped or moved in the scene, while the function is
+    still called once for the points of all of them.
+
+    :param kwargs: Transform kwargs
+    """
+    targets = [mobject.copy() for mobject in mobjects]
+    map_family_points(function, *targets)
+    return [Transform(mobject, target, **kwargs) for mobject, target in zip(mobjects, targets)]
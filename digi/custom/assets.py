@@ -0,0 +1,208 @@
+"""
+Compiled form of the custom svgs.
+
+Every svg parsed by a CompiledSVGMobject is written next to it, into compiled/<name>/<style>/,
+as raw float arrays of points and style plus a small meta file holding the hash of the
+svg content. The parse bakes the constructor style into the members, so every style gets
+its own compiled form. The next construction memory-maps the arrays instead of parsing
+the xml; editing the svg changes the hash and the file gets compiled again.
+
+Build step and parse cost measurement::
+
+    python -m custom.assets build
+    python -m custom.assets bench
+"""
+from __future__ import annotations
+import hashlib
+import os
+import sys
+import time
+from abc import ABC
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from manim import *
+
+SVG_DIRS = [Path(__file__).parent / "svgs", Path(__file__).parent / "characters" / "svgs"]
+COMPILED_DIR_NAME = "compiled"
+# Per-member arrays, stored concatenated in <name>.npy files
+STYLE_ARRAYS = ["points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
+# Per-member scalars, stored in meta.npz
+STYLE_SCALARS = ["stroke_width", "background_stroke_width"]
+# Constructor kwargs the parse mixes into the style of the members
+STYLE_OPTIONS = ["color", "fill_color", "fill_opacity", "stroke_color", "stroke_width", "stroke_opacity"]
+PARSE_OPTIONS = ["unpack_groups", "should_subdivide_sharp_curves", "should_remove_null_curves"]
+
+
+def get_style_key(svg_mobject: SVGMobject) -> str:
+    style = ",".join(f"{option}={getattr(svg_mobject, option, None)}" for option in STYLE_OPTIONS)
+    return hashlib.sha1(style.encode()).hexdigest()[:12]
+
+
+def get_compiled_dir(svg_mobject: SVGMobject) -> Path:
+    file_path = get_svg_path(svg_mobject)
+    return file_path.parent / COMPILED_DIR_NAME / file_path.stem / get_style_key(svg_mobject)
+
+
+def get_svg_path(svg_mobject: SVGMobject) -> Path:
+    # file_name is what the caller passed, often without the .svg suffix; file_path is the resolved file
+    return Path(getattr(svg_mobject, "file_path", None) or svg_mobject.file_name)
+
+
+def get_svg_hash(svg_mobject: SVGMobject) -> str:
+    """
+    Hash of the svg content together with the options and the style that change the parsing.
+    """
+    sha = hashlib.sha1(get_svg_path(svg_mobject).read_bytes())
+    for option in PARSE_OPTIONS + STYLE_OPTIONS:
+        sha.update(f"{option}={getattr(svg_mobject, option, None)}".encode())
+    return sha.hexdigest()
+
+
+def save_compiled_svg(svg_mobject: SVGMobject, svg_hash: str) -> None:
+    members = svg_mobject.get_family()[1:]
+    index = {id(member): idx for idx, member in enumerate(members)}
+    parents = [-1] * len(members)
+    for member in svg_mobject.get_family():
+        for submobject in member.submobjects:
+            if member is not svg_mobject:
+                parents[index[id(submobject)]] = index[id(member)]
+
+    compiled_dir = get_compiled_dir(svg_mobject)
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+    meta = {"hash": np.array(svg_hash), "parents": np.array(parents)}
+    for name in STYLE_ARRAYS:
+        arrays = [np.asarray(getattr(member, name), dtype=float).reshape(-1, 3 if name == "points" else 4)
+                  for member in members]
+        meta[f"{name}_offsets"] = np.cumsum([0] + [len(array) for array in arrays])
+        _atomic_save(compiled_dir / f"{name}.npy", np.concatenate(arrays))
+    for name in STYLE_SCALARS:
+        meta[name] = np.array([float(getattr(member, name)) for member in members])
+    # The meta file goes last, its hash is what makes the arrays valid
+    _atomic_save(compiled_dir / "meta.npz", meta)
+
+
+def _atomic_save(path: Path, data) -> None:
+    # Scenes warm up on several threads, a reader must never see a half-written file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{id(data)}.tmp")
+    with open(tmp_path, "wb") as f:
+        if isinstance(data, dict):
+            np.savez(f, **data)
+        else:
+            np.save(f, data)
+    os.replace(tmp_path, path)
+
+
+def load_compiled_svg(svg_mobject: SVGMobject, svg_hash: str) -> bool:
+    """
+    Adds the compiled members to the svg mobject. Returns False if there is
+    no compiled form matching the svg content.
+    """
+    compiled_dir = get_compiled_dir(svg_mobject)
+    try:
+        with np.load(compiled_dir / "meta.npz") as meta_file:
+            meta = dict(meta_file)
+        if str(meta["hash"]) != svg_hash:
+            return False
+        arrays = {name: np.load(compiled_dir / f"{name}.npy", mmap_mode="r") for name in STYLE_ARRAYS}
+    except (OSError, KeyError, ValueError):
+        return False
+
+    members = []
+    for idx, parent in enumerate(meta["parents"]):
+        data = {}
+        for name in STYLE_ARRAYS:
+            offsets = meta[f"{name}_offsets"]
+            data[name] = np.array(arrays[name][offsets[idx]:offsets[idx + 1]])
+        member = VMobject(
+            fill_color=rgba_to_color(data["fill_rgbas"][0]),
+            fill_opacity=data["fill_rgbas"][0, 3],
+            stroke_color=rgba_to_color(data["stroke_rgbas"][0]),
+            stroke_opacity=data["stroke_rgbas"][0, 3],
+            stroke_width=meta["stroke_width"][idx],
+        )
+        for name, value in data.items():
+            setattr(member, name, value)
+        member.background_stroke_width = meta["background_stroke_width"][idx]
+        members.append(member)
+        if parent < 0:
+            svg_mobject.add(member)
+        else:
+            members[parent].add(member)
+    return True
+
+
+class CompiledSVGMobject(SVGMobject, ABC):
+    """
+    SVGMobject loading its geometry from the compiled form of the svg and writing
+    that form on the first parse. Only the cairo renderer is supported, with OpenGL
+    the svg is always parsed.
+    """
+    use_compiled_assets = True
+
+    def generate_points(self) -> None:
+        if not self.use_compiled_assets or config.renderer == "opengl":
+            super(CompiledSVGMobject, self).generate_points()
+            return
+        try:
+            svg_hash = get_svg_hash(self)
+            if load_compiled_svg(self, svg_hash):
+                return
+        except Exception as e:
+            # The cache must never keep an svg from loading, it is parsed as usual
+            logger.warning(f"Could not load the compiled form of {self.file_name}: {e}")
+            self.submobjects = []
+            super(CompiledSVGMobject, self).generate_points()
+            return
+        super(CompiledSVGMobject, self).generate_points()
+        try:
+            save_compiled_svg(self, svg_hash)
+        except OSError as e:
+            logger.warning(f"Could not compile {self.file_name}: {e}")
+
+
+def get_svg_files() -> List[Path]:
+    return sorted(path for svg_dir in SVG_DIRS for path in svg_dir.glob("*.svg"))
+
+
+def build_compiled_assets() -> List[Path]:
+    """
+    Compiles every custom svg, stale or missing compiled forms are rewritten.
+    """
+    for path in get_svg_files():
+        CompiledSVGMobject(file_name=str(path))
+    return get_svg_files()
+
+
+def benchmark_svg_loading(repeat: int = 5) -> Dict[str, tuple]:
+    """
+    Mean construction time of every custom svg, parsed and loaded from the compiled form.
+    """
+    build_compiled_assets()
+    timings = {}
+    for path in get_svg_files():
+        times = []
+        for mobject_class in [SVGMobject, CompiledSVGMobject]:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                mobject_class(file_name=str(path))
+            times.append((time.perf_counter() - start) / repeat)
+        timings[path.name] = tuple(times)
+    return timings
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if command == "build":
+        for svg_file in build_compiled_assets():
+            print(f"compiled {svg_file}")
+    elif command == "bench":
+        results = benchmark_svg_loading()
+        print(f"{'svg':<40}{'parse, ms':>12}{'compiled, ms':>14}")
+        for name, (parse_time, compiled_time) in results.items():
+            print(f"{name:<40}{1000 * parse_time:>12.2f}{1000 * compiled_time:>14.2f}")
+        total_parse, total_compiled = map(sum, zip(*results.values()))
+        print(f"{'total':<40}{1000 * total_parse:>12.2f}{1000 * total_compiled:>14.2f}")
+    else:
+        raise SystemExit(f"Unknown command {command}, expected build or bench")
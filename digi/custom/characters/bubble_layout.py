@@ -0,0 +1,82 @@
+from __future__ import annotations
+from typing import List, Tuple
+
+import numpy as np
+from manim import *
+from ..drawings import Bubble
+from ..utils import TemplateCache
+
+
+class BubbleLayout:
+    def __init__(self, step: float = 0.5, max_steps: int = 4, buff: float = SMALL_BUFF, memo_size: int = 256) -> None:
+        """
+        Places the bubbles of several talking pi-creatures at once, so that they stay on
+        screen and neither overlap each other nor cover the creatures. A bubble pinned to
+        its creature is the starting point, the placement is the cheapest shift of it from
+        a grid of candidates. Placements are memoized by bubble size, creature position
+        and obstacles.
+
+        :param step: the distance between candidate shifts
+        :param max_steps: the number of candidate steps in each direction
+        :param buff: the margin kept around the bubbles
+        :param memo_size: the number of memoized placements
+        """
+        self.buff = buff
+        offsets = step * np.arange(-max_steps, max_steps + 1)
+        self.candidates = np.array([[dx, dy] for dx in offsets for dy in offsets])
+        # Small shifts first, so that ties keep the bubble close to its creature
+        self.candidates = self.candidates[np.argsort(np.linalg.norm(self.candidates, axis=1), kind="stable")]
+        self.placements = TemplateCache(max_size=memo_size)
+
+    @staticmethod
+    def get_box(*mobjects: Mobject) -> np.ndarray:
+        points = np.concatenate([mobject.get_all_points().reshape(-1, 3) for mobject in mobjects])
+        if len(points) == 0:
+            return np.zeros((2, 2))
+        return np.array([points.min(axis=0)[:2], points.max(axis=0)[:2]])
+
+    def get_costs(self, box: np.ndarray, obstacles: np.ndarray) -> np.ndarray:
+        """
+        Costs of all the candidate shifts of a box: the area overlapping the
+        obstacles and the area off screen outweigh the shift length.
+        """
+        boxes = box[None] + self.candidates[:, None]
+        boxes[:, 0] -= self.buff
+        boxes[:, 1] += self.buff
+        areas = np.prod(boxes[:, 1] - boxes[:, 0], axis=1)
+
+        frame = np.array([config.frame_x_radius, config.frame_y_radius])
+        on_screen = np.prod(np.clip(np.minimum(boxes[:, 1], frame) - np.maximum(boxes[:, 0], -frame), 0, None), axis=1)
+        cost = 100 * (areas - on_screen)
+        if len(obstacles) > 0:
+            lows = np.maximum(boxes[:, None, 0], obstacles[None, :, 0])
+            highs = np.minimum(boxes[:, None, 1], obstacles[None, :, 1])
+            cost += 10 * np.prod(np.clip(highs - lows, 0, None), axis=2).sum(axis=1)
+        return cost + np.linalg.norm(self.candidates, axis=1)
+
+    def place(self, bubbles: List[Tuple[Mobject, Bubble]], obstacles: List[Mobject] = None) -> List[Bubble]:
+        """
+        Places the bubbles in one pass, each placed bubble becomes an obstacle for the next ones.
+
+        :param bubbles: (pi-creature, bubble pinned to it) pairs
+        :param obstacles: mobjects to keep clear of, besides the creatures themselves
+        """
+        obstacles = list(obstacles or []) + [pi for pi, _ in bubbles]
+        obstacle_boxes = [self.get_box(obstacle) for obstacle in obstacles]
+        for pi_creature, bubble in sorted(bubbles, key=lambda pair: pair[0].get_center()[0]):
+            box = self.get_box(bubble, bubble.content)
+            key = (
+                type(bubble).__name__,
+                tuple(np.round(box[1] - box[0], 2)),
+                tuple(np.round(pi_creature.get_center()[:2], 2)),
+                tuple(np.round(np.ravel(obstacle_boxes), 1))
+            )
+            shift = self.placements.get(key)
+            if shift is None:
+                costs = self.get_costs(box, np.array(obstacle_boxes).reshape(-1, 2, 2))
+                shift = self.placements.put(key, self.candidates[np.argmin(costs)])
+            vector = np.array([shift[0], shift[1], 0])
+            bubble.shift(vector)
+            bubble.content.shift(vector)
+            obstacle_boxes.append(box + shift)
+        return [bubble for _, bubble in bubbles]
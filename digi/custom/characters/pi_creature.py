@@ -2,12 +2,16 @@ from __future__ import annotations
 import os
 from abc import ABC
 from pathlib import Path
-from typing import Union
+from typing import Union, Dict
 
 import numpy as np
 from manim import *
 from ..drawings import ThoughtBubble, Bubble
-from ..utils import parent_kwargs
+from ..utils import parent_kwargs, TemplateCache
+from ..assets import CompiledSVGMobject
+from ..shared_arrays import copy_on_write
+from ..content_cache import cached_text
+from .pi_creature_eyes import EyeRig, get_bounding_boxes, get_pupil_centers, render_pupils
 
 PI_CREATURE_SCALE_FACTOR = 0.5
 
@@ -18,8 +22,12 @@ RIGHT_PUPIL_INDEX = 3
 BODY_INDEX = 4
 MOUTH_INDEX = 5
 
+# Parsed, colored and part-named creatures keyed by (file_name_prefix, mode, style).
+# Constructors and change_mode clone their parts from here instead of reparsing the svg.
+PI_CREATURE_TEMPLATES = TemplateCache(max_size=64)
 
-class PiCreature(SVGMobject, ABC):
+
+class PiCreature(CompiledSVGMobject, ABC):
     def __init__(self, mode: str = "plain", **kwargs) -> None:
         """
         :param mode: pi-creature emotion
@@ -33,6 +41,7 @@ class PiCreature(SVGMobject, ABC):
            * **start_corner** - the corner pi-creature appears at the beginning
            * **pupil_to_eye_width_ratio** - the ratio of pupil towards eye
            * **pupil_dot_to_pupil_width_ratio** - the ratio of pupil' dot towards pupil
+           * **use_rig** - change modes through the shared blendshape rig when possible
 
         SVGMobject kwargs:
            * **color** - color of pi-creature body
@@ -48,6 +57,8 @@ class PiCreature(SVGMobject, ABC):
         self.start_corner = kwargs.pop("start_corner", None)
         self.pupil_to_eye_width_ratio = kwargs.pop("pupil_to_eye_width_ratio", 0.4)
         self.pupil_dot_to_pupil_width_ratio = kwargs.pop("pupil_dot_to_pupil_width_ratio", 0.3)
+        self.use_rig = kwargs.pop("use_rig", True)
+        self.eye_rig = EyeRig(self.pupil_to_eye_width_ratio, self.pupil_dot_to_pupil_width_ratio)
 
         self.mouth = None
         self.body = None
@@ -58,11 +69,18 @@ class PiCreature(SVGMobject, ABC):
         self.mode = mode
         self.parts_named = False
 
+        svg_kwargs = parent_kwargs(self, **kwargs)
+        self.svg_kwargs = svg_kwargs
+        template_key = self.get_template_key(mode, svg_kwargs)
+        self.template = PI_CREATURE_TEMPLATES.get(template_key)
         try:
             svg_file = str(Path(__file__).parent / f"svgs/{self.file_name_prefix}_{mode}.svg")
-            super(PiCreature, self).__init__(file_name=svg_file, **parent_kwargs(self, **kwargs))
+            super(PiCreature, self).__init__(file_name=svg_file, **svg_kwargs)
         except IOError as e:
             raise e
+        if self.template is None:
+            PI_CREATURE_TEMPLATES.put(template_key, self.copy())
+        self.template = None
 
         if self.flip_at_start:
             self.flip()
@@ -71,6 +89,30 @@ class PiCreature(SVGMobject, ABC):
 
         self.purposeful_looking_direction = None
 
+    def get_template_key(self, mode: str, svg_kwargs: dict) -> tuple:
+        style = tuple((key, str(value)) for key, value in sorted(svg_kwargs.items()))
+        style += (
+            ("pupil_to_eye_width_ratio", self.pupil_to_eye_width_ratio),
+            ("pupil_dot_to_pupil_width_ratio", self.pupil_dot_to_pupil_width_ratio),
+        )
+        return self.file_name_prefix, mode, style
+
+    def get_style_kwargs(self) -> dict:
+        """
+        Kwargs building a creature of the same style, e.g. to warm up its templates.
+        """
+        return dict(
+            self.svg_kwargs,
+            pupil_to_eye_width_ratio=self.pupil_to_eye_width_ratio,
+            pupil_dot_to_pupil_width_ratio=self.pupil_dot_to_pupil_width_ratio,
+        )
+
+    def generate_points(self) -> None:
+        if self.template is None:
+            super(PiCreature, self).generate_points()
+        else:
+            self.add(*copy_on_write(self.template).submobjects)
+
     def align_data(self, mobject: Mobject) -> None:
         # This ensures that after a transform into a different mode,
         # the pi creatures mode will be updated appropriately
@@ -93,6 +135,12 @@ class PiCreature(SVGMobject, ABC):
         self.parts_named = True
 
     def init_colors(self, propagate_colors: bool = False) -> PiCreature:
+        if self.template is not None:
+            # Parts cloned from a template already carry its colors and pupils, only the
+            # creature itself needs its style arrays for become, Transform and match_style
+            self.init_root_colors()
+            self.name_parts()
+            return self
         super(PiCreature, self).init_colors(propagate_colors)
         if not self.parts_named:
             self.name_parts()
@@ -103,39 +151,34 @@ class PiCreature(SVGMobject, ABC):
         self.init_pupils()
         return self
 
+    def init_root_colors(self) -> None:
+        # VMobject.init_colors without the walk over the parts
+        self.set_fill(self.fill_color or self.color, self.fill_opacity, family=False)
+        self.set_stroke(self.stroke_color or self.color, self.stroke_width, self.stroke_opacity, family=False)
+        self.set_background_stroke(
+            color=self.background_stroke_color,
+            width=self.background_stroke_width,
+            opacity=self.background_stroke_opacity,
+            family=False,
+        )
+        self.set_sheen(self.sheen_factor, self.sheen_direction, family=False)
+
     def init_pupils(self) -> None:
-        # Instead of what is drawn, make new circles.
-        # This is mostly because the paths associated
-        # with the eyes in all the drawings got slightly
-        # messed up.
-        for eye, pupil in zip(self.eyes, self.pupils):
-            pupil_r = eye.get_width() / 2
-            pupil_r *= self.pupil_to_eye_width_ratio
-            dot_r = pupil_r
-            dot_r *= self.pupil_dot_to_pupil_width_ratio
-
-            new_pupil = Circle(
-                radius=pupil_r,
-                color=BLACK,
-                fill_opacity=1,
-                stroke_width=0,
-            )
-            dot = Circle(
-                radius=dot_r,
-                color=WHITE,
-                fill_opacity=1,
-                stroke_width=0,
-            )
-            new_pupil.move_to(pupil)
-            pupil.become(new_pupil)
-            dot.shift(
-                new_pupil.get_boundary_point(UL) -
-                dot.get_boundary_point(UL)
-            )
-            pupil.add(dot)
+        # Instead of what is drawn, generate the pupils from the unit circle.
+        # This is mostly because the paths associated with the eyes in all
+        # the drawings got slightly messed up.
+        radii = self.eye_rig.get_pupil_radii(get_bounding_boxes(self.eyes))
+        centers = np.array([pupil.get_center() for pupil in self.pupils])
+        for pupil in self.pupils:
+            pupil.set_fill(BLACK, opacity=1)
+            pupil.set_stroke(width=0)
+        render_pupils(self.pupils, centers, radii, np.full(2, self.eye_rig.pupil_dot_to_pupil_width_ratio),
+                      np.full(2, self.is_flipped()))
 
     def copy(self) -> PiCreature:
-        copy_mobject = SVGMobject.copy(self)
+        # Parts share their point and style buffers with the original until either side writes,
+        # so copies taken only to build a target or read a position cost next to nothing
+        copy_mobject = copy_on_write(self)
         copy_mobject.name_parts()
         return copy_mobject
 
@@ -145,6 +188,10 @@ class PiCreature(SVGMobject, ABC):
         return self
 
     def change_mode(self, mode: str) -> PiCreature:
+        if self.use_rig and get_pi_creature_rig(self.file_name_prefix).can_pose(self, mode):
+            return self.blend_modes({mode: 1.0})
+
+        # Cheap after the first use of a mode, the parts are cloned from PI_CREATURE_TEMPLATES
         new_self = self.__class__(
             mode=mode,
         )
@@ -160,33 +207,37 @@ class PiCreature(SVGMobject, ABC):
         self.mode = mode
         return self
 
+    def blend_modes(self, weights: Dict[str, float]) -> PiCreature:
+        """
+        Poses the creature as a weighted mix of modes, e.g. {"plain": 0.5, "happy": 0.5}.
+        The dominant mode becomes the creature's mode.
+        """
+        get_pi_creature_rig(self.file_name_prefix).pose(self, weights)
+        self.mode = max(weights, key=weights.get)
+        if self.purposeful_looking_direction is not None:
+            self.look(self.purposeful_looking_direction)
+        return self
+
+    def align_to_rig(self) -> PiCreature:
+        """
+        Brings the creature to the rig topology, so that transforms
+        towards rig-posed targets need no point alignment.
+        """
+        if self.use_rig:
+            get_pi_creature_rig(self.file_name_prefix).conform(self)
+        return self
+
     def get_mode(self) -> str:
         return self.mode
 
     def look(self, direction: np.array) -> Union[None, PiCreature]:
-        norm = np.linalg.norm(direction)
-        if norm == 0:
+        if np.linalg.norm(direction) == 0:
             return
-        direction /= norm
-        self.purposeful_looking_direction = direction
-        for pupil, eye in zip(self.pupils.split(), self.eyes.split()):
-            c = eye.get_center()
-            right = eye.get_right() - c
-            up = eye.get_top() - c
-            vect = direction[0] * right + direction[1] * up
-            v_norm = np.linalg.norm(vect)
-            p_radius = 0.5 * pupil.get_width()
-            vect *= (v_norm - 0.75 * p_radius) / v_norm
-            pupil.move_to(c + vect)
-        self.pupils[1].align_to(self.pupils[0], DOWN)
+        look_many([self], direction)
         return self
 
     def look_at(self, point_or_mobject: Union[Mobject, np.ndarray]) -> PiCreature:
-        if isinstance(point_or_mobject, Mobject):
-            point = point_or_mobject.get_center()
-        else:
-            point = point_or_mobject
-        self.look(point - self.eyes.get_center())
+        look_at_many([self], point_or_mobject)
         return self
 
     def change(self, new_mode: str, look_at_arg=None) -> PiCreature:
@@ -222,15 +273,14 @@ class PiCreature(SVGMobject, ABC):
             self.to_corner(DOWN + LEFT, **kwargs)
         return self
 
+    def get_bubble_content(self, content: Union[Mobject, str]) -> Mobject:
+        return cached_text(content) if isinstance(content, str) else content
+
     def get_bubble(self, content: Union[SVGMobject, str], **kwargs) -> Bubble:
         bubble_class = kwargs.pop('bubble_class', ThoughtBubble)
         bubble = bubble_class(**kwargs)
         if len(content) > 0:
-            if isinstance(content[0], str):
-                content_mob = Text(content)
-            else:
-                content_mob = content
-            bubble.add_content(content_mob)
+            bubble.add_content(self.get_bubble_content(content))
             if "height" not in kwargs and "width" not in kwargs:
                 bubble.resize_to_content()
         bubble.pin_to(self)
@@ -253,9 +303,74 @@ class PiCreature(SVGMobject, ABC):
         return self
 
 
-def get_all_pi_creature_modes() -> list:
+def _look(pi_creatures: list, directions: np.ndarray, eye_boxes: np.ndarray) -> None:
+    norms = np.linalg.norm(directions, axis=1)
+    looking = norms > 0
+    if not looking.any():
+        return
+    pi_creatures = [pi for pi, is_looking in zip(pi_creatures, looking) if is_looking]
+    directions = directions[looking] / norms[looking, None]
+    eye_boxes = eye_boxes[np.repeat(looking, 2)]
+
+    eye_rigs = [pi.eye_rig for pi in pi_creatures]
+    radii = np.repeat([rig.pupil_to_eye_width_ratio for rig in eye_rigs], 2)
+    radii *= (eye_boxes[:, 1, 0] - eye_boxes[:, 0, 0]) / 2
+    dot_ratios = np.repeat([rig.pupil_dot_to_pupil_width_ratio for rig in eye_rigs], 2)
+    centers = get_pupil_centers(eye_boxes, np.repeat(directions, 2, axis=0), radii)
+    eye_centers_x = eye_boxes[:, :, 0].mean(axis=1)
+    flipped = np.repeat(eye_centers_x[0::2] > eye_centers_x[1::2], 2)
+    render_pupils([pupil for pi in pi_creatures for pupil in pi.pupils], centers, radii, dot_ratios, flipped)
+
+    for pi, direction in zip(pi_creatures, directions):
+        pi.eye_rig.gaze = direction
+        pi.purposeful_looking_direction = direction
+
+
+def look_many(pi_creatures: list, directions: np.ndarray) -> list:
+    """
+    Vectorized PiCreature.look for a group of creatures.
+
+    :param pi_creatures: the creatures
+    :param directions: one direction for all of them or one per creature
+    """
+    pi_creatures = list(pi_creatures)
+    if len(pi_creatures) == 0:
+        return pi_creatures
+    directions = np.array(np.broadcast_to(directions, (len(pi_creatures), 3)), dtype=float)
+    eyes = [eye for pi in pi_creatures for eye in pi.eyes]
+    _look(pi_creatures, directions, get_bounding_boxes(eyes))
+    return pi_creatures
+
+
+def look_at_many(pi_creatures: list, targets: Union[Mobject, np.ndarray, list]) -> list:
+    """
+    Vectorized PiCreature.look_at for a group of creatures.
+
+    :param pi_creatures: the creatures
+    :param targets: a mobject or point for all of them, or a list with one per creature
+    """
+    pi_creatures = list(pi_creatures)
+    if len(pi_creatures) == 0:
+        return pi_creatures
+    if isinstance(targets, (list, tuple)) and len(targets) > 0 and \
+            isinstance(targets[0], (Mobject, list, tuple, np.ndarray)):
+        points = [target.get_center() if isinstance(target, Mobject) else target for target in targets]
+    else:
+        points = [targets.get_center() if isinstance(targets, Mobject) else targets]
+    points = np.broadcast_to(np.array(points, dtype=float), (len(pi_creatures), 3))
+
+    eyes = [eye for pi in pi_creatures for eye in pi.eyes]
+    eye_boxes = get_bounding_boxes(eyes)
+    # Both eyes of a creature together, as in pi.eyes.get_center()
+    eyes_centers = (np.minimum(eye_boxes[0::2, 0], eye_boxes[1::2, 0]) +
+                    np.maximum(eye_boxes[0::2, 1], eye_boxes[1::2, 1])) / 2
+    _look(pi_creatures, points - eyes_centers, eye_boxes)
+    return pi_creatures
+
+
+def get_all_pi_creature_modes(file_name_prefix: str = "PiCreature") -> list:
     result = []
-    prefix = PiCreature.self_defaults["file_name_prefix"] + "_"
+    prefix = file_name_prefix + "_"
     suffix = ".svg"
     for file in os.listdir(Path(__file__).parent / "svgs"):
         if file.startswith(prefix) and file.endswith(suffix):
@@ -265,6 +380,103 @@ def get_all_pi_creature_modes() -> list:
     return result
 
 
+class PiCreatureRig:
+    def __init__(self, file_name_prefix: str = "PiCreature", modes: list = None, base_mode: str = "plain") -> None:
+        """
+        Blendshape rig of pi-creature modes. All the modes are aligned once to a common
+        point topology and stored as deltas from the base mode, so posing a creature in a
+        mode, or in a weighted mix of modes, is a single multiply-add.
+
+        :param file_name_prefix: the filename prefix of the svgs
+        :param modes: modes to rig (default: all the modes found in the svgs directory)
+        :param base_mode: the mode the deltas are taken from
+        """
+        self.file_name_prefix = file_name_prefix
+        self.base_mode = base_mode
+        if modes is None:
+            modes = get_all_pi_creature_modes(file_name_prefix)
+
+        # Every mode is normalized the way change_mode matches a new mode to the
+        # old one: unit height and eyes centered at the origin.
+        shapes = {}
+        for mode in modes:
+            creature = PiCreature(mode=mode, file_name_prefix=file_name_prefix, use_rig=False)
+            creature.set_height(1)
+            creature.shift(-creature.eyes.get_center())
+            shapes[mode] = creature.family_members_with_points()
+        # Only the modes sharing the base layout can be blended
+        layout_size = len(shapes[base_mode])
+        shapes = {mode: parts for mode, parts in shapes.items() if len(parts) == layout_size}
+
+        num_curves = [
+            max(parts[index].get_num_curves() for parts in shapes.values())
+            for index in range(layout_size)
+        ]
+        for parts in shapes.values():
+            for part, n in zip(parts, num_curves):
+                if part.get_num_curves() < n:
+                    part.insert_n_curves(n - part.get_num_curves())
+        n_points_per_curve = shapes[base_mode][0].n_points_per_cubic_curve
+        self.part_sizes = [n * n_points_per_curve for n in num_curves]
+
+        self.modes = list(shapes.keys())
+        self.mode_index = {mode: index for index, mode in enumerate(self.modes)}
+        poses = np.array([
+            np.concatenate([part.points for part in parts])
+            for parts in shapes.values()
+        ])
+        self.base = poses[self.mode_index[base_mode]]
+        self.deltas = poses - self.base
+
+    def conform(self, pi_creature: PiCreature) -> bool:
+        """
+        Inserts curves into the creature parts to match the rig topology.
+        Returns False if the creature cannot be brought to it.
+        """
+        parts = pi_creature.family_members_with_points()
+        if len(parts) != len(self.part_sizes):
+            return False
+        for part, size in zip(parts, self.part_sizes):
+            if len(part.points) > size:
+                return False
+        for part, size in zip(parts, self.part_sizes):
+            if len(part.points) < size:
+                part.insert_n_curves((size - len(part.points)) // part.n_points_per_cubic_curve)
+        return True
+
+    def can_pose(self, pi_creature: PiCreature, mode: str) -> bool:
+        return mode in self.mode_index and self.conform(pi_creature)
+
+    def blend(self, weights: Dict[str, float]) -> np.ndarray:
+        indices = [self.mode_index[mode] for mode in weights.keys()]
+        return self.base + np.tensordot(np.array(list(weights.values())), self.deltas[indices], axes=1)
+
+    def pose(self, pi_creature: PiCreature, weights: Dict[str, float]) -> PiCreature:
+        if not self.conform(pi_creature):
+            raise ValueError(f"{type(pi_creature).__name__} does not match the rig topology")
+        points = self.blend(weights) * pi_creature.get_height()
+        if pi_creature.is_flipped():
+            points[:, 0] *= -1
+        points += pi_creature.eyes.get_center()
+        start = 0
+        for part, size in zip(pi_creature.family_members_with_points(), self.part_sizes):
+            part.set_points(points[start:start + size])
+            start += size
+        return pi_creature
+
+
+_PI_CREATURE_RIGS = {}
+
+
+def get_pi_creature_rig(file_name_prefix: str = "PiCreature") -> PiCreatureRig:
+    """
+    The rig is built once per svg set, on the first mode change.
+    """
+    if file_name_prefix not in _PI_CREATURE_RIGS:
+        _PI_CREATURE_RIGS[file_name_prefix] = PiCreatureRig(file_name_prefix)
+    return _PI_CREATURE_RIGS[file_name_prefix]
+
+
 class Alex(PiCreature, ABC):
     pass  # Nothing more than an alternative name
 
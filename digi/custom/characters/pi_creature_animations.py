@@ -1,12 +1,145 @@
 from __future__ import annotations
+from typing import Callable
+
 from .pi_creature import *
 from ..drawings import SpeechBubble
 from ..utils import parent_kwargs
 
 
-class Blink(ApplyMethod):
+def squish_windows_rate_func(func: Callable[[float], float], windows: list) -> Callable[[float], float]:
+    """
+    Like squish_rate_func, but runs func once in each of the (start, end) windows,
+    which mustn't overlap. Before, between and after the windows it holds func(0) or func(1).
+    """
+    starts, ends = np.array(sorted(windows), dtype=float).reshape(-1, 2).T
+
+    def result(t: float) -> float:
+        index = np.searchsorted(starts, t, side="right") - 1
+        if index < 0:
+            return func(0)
+        if t >= ends[index]:
+            return func(1)
+        return func((t - starts[index]) / (ends[index] - starts[index]))
+
+    return result
+
+
+def vectorized_there_and_back(t: np.ndarray, inflection: float = 10.0) -> np.ndarray:
+    """
+    there_and_back over an array of alphas.
+    """
+    t = np.where(t < 0.5, 2 * t, 2 - 2 * t)
+    error = sigmoid(-inflection / 2)
+    return np.clip((sigmoid(inflection * (t - 0.5)) - error) / (1 - 2 * error), 0, 1)
+
+
+class EyeRows:
+    """
+    Eye parts of several creatures whose points are moved into one buffer, so that
+    closing the eyes of all of them to any degree is a single vectorized write.
+    The parts hold views of the buffer until release is called.
+    """
+
+    def __init__(self, pi_creatures: list) -> None:
+        parts = [pi.eye_parts.family_members_with_points() for pi in pi_creatures]
+        self.parts = [part for creature_parts in parts for part in creature_parts]
+        sizes = [len(part.points) for part in self.parts]
+        self.buffer = np.concatenate([np.asarray(part.points) for part in self.parts] or [np.zeros((0, 3))])
+        self.owners = np.repeat(np.arange(len(pi_creatures)), [
+            sum(len(part.points) for part in creature_parts) for creature_parts in parts
+        ])
+        bottoms = np.array([pi.eye_parts.get_bottom()[1] for pi in pi_creatures])
+        self.rows = self.buffer[:, 1].copy()
+        self.to_bottom = bottoms[self.owners] - self.rows
+        for part, start, size in zip(self.parts, np.cumsum([0] + sizes), sizes):
+            part.points = self.buffer[start:start + size]
+
+    def close(self, closing: np.ndarray) -> None:
+        """
+        :param closing: per creature, 0 for open eyes, 1 for eyes squeezed to their bottom line
+        """
+        self.buffer[:, 1] = self.rows + closing[self.owners] * self.to_bottom
+
+    def release(self) -> None:
+        for part in self.parts:
+            part.points = np.array(part.points)
+
+
+class Blink(Animation):
     def __init__(self, pi_creature: PiCreature, **kwargs) -> None:
-        super(Blink, self).__init__(pi_creature.blink, rate_func=squish_rate_func(there_and_back), **kwargs)
+        """
+        Squeezes the eyes down to their bottom line and back, as PiCreature.blink does.
+        Only the y coordinates of the eye parts are rewritten each frame, the creature
+        is neither copied into a target nor interpolated.
+
+        :param pi_creature: the blinking creature
+        :param kwargs: Animation kwargs, rate_func defaults to squish_rate_func(there_and_back)
+        """
+        kwargs.setdefault("rate_func", squish_rate_func(there_and_back))
+        self.eye_rows = None
+        super(Blink, self).__init__(pi_creature, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # Nothing is interpolated from a starting copy
+        return self.mobject
+
+    def begin(self) -> None:
+        self.eye_rows = EyeRows([self.mobject])
+        super(Blink, self).begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        self.eye_rows.close(np.array([self.rate_func(alpha)]))
+
+    def finish(self) -> None:
+        super(Blink, self).finish()
+        self.eye_rows.release()
+
+
+class CrowdBlink(Animation):
+    # PiCreatureScene keeps the group out of the scene while its creatures are on screen
+    leaves_group_out_of_scene = True
+
+    def __init__(self, pi_creatures: list, **kwargs) -> None:
+        """
+        Blinks of many creatures as one animation. Every frame evaluates the blinks of
+        all the creatures over an array of their windows and writes all the eyes at once.
+
+        PiCreatureScene leaves the group of the creatures out of the scene, so they keep their
+        place in it. Other scenes add the group on top, as for any AnimationGroup.
+
+        :param pi_creatures: the blinking creatures, by default they blink one after another in this order
+        :param kwargs: Animation kwargs, rate_func defaults to linear, and
+
+           * **windows** - (start, end) alphas of the blink of each creature, staggered by default
+           * **blink_length** - length of a staggered window, 0.2 by default
+        """
+        self.pi_creatures = list(pi_creatures)
+        blink_length = kwargs.pop("blink_length", 0.2)
+        windows = kwargs.pop("windows", None)
+        if windows is None:
+            starts = (1 - blink_length) * np.arange(len(self.pi_creatures)) / max(len(self.pi_creatures), 1)
+            windows = np.column_stack([starts, starts + blink_length])
+        self.windows = np.asarray(windows, dtype=float).reshape(-1, 2)
+        # The windows already shape every blink, the rate func only moves time through them
+        kwargs.setdefault("rate_func", linear)
+        self.eye_rows = None
+        super(CrowdBlink, self).__init__(Group(*self.pi_creatures), **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+    def begin(self) -> None:
+        self.eye_rows = EyeRows(self.pi_creatures)
+        super(CrowdBlink, self).begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        starts, ends = self.windows.T
+        local_alphas = np.clip((self.rate_func(alpha) - starts) / (ends - starts), 0, 1)
+        self.eye_rows.close(vectorized_there_and_back(local_alphas))
+
+    def finish(self) -> None:
+        super(CrowdBlink, self).finish()
+        self.eye_rows.release()
 
 
 class PiCreatureBubbleIntroduction(AnimationGroup):
@@ -17,6 +150,11 @@ class PiCreatureBubbleIntroduction(AnimationGroup):
         :param pi_creature:
         :param content:
         :param kwargs:
+
+        Layout kwargs:
+           * **bubble** - a bubble already built with pi_creature.get_bubble and placed, content is ignored
+           * **bubble_layout** - BubbleLayout placing the bubble instead of shifting it onto screen
+           * **layout_obstacles** - mobjects the layout keeps the bubble clear of
         """
         self.target_mode = kwargs.pop("target_mode", "speaking")
         self.bubble_class = kwargs.pop("bubble_class", SpeechBubble)
@@ -27,14 +165,25 @@ class PiCreatureBubbleIntroduction(AnimationGroup):
         self.content_introduction_class = kwargs.pop("content_introduction_class", Write)
         self.content_introduction_kwargs = kwargs.pop("content_introduction_kwargs", {})
         self.look_at_arg = kwargs.pop("look_at_arg", None)
-
-        bubble = pi_creature.get_bubble(
-            *content,
-            bubble_class=self.bubble_class,
-            **self.bubble_kwargs
-        )
-        Group(bubble, bubble.content).shift_onto_screen()
-
+        self.bubble = kwargs.pop("bubble", None)
+        self.bubble_layout = kwargs.pop("bubble_layout", None)
+        self.layout_obstacles = kwargs.pop("layout_obstacles", [])
+
+        if self.bubble is not None:
+            # Already built and placed by the caller
+            bubble = self.bubble
+        else:
+            bubble = pi_creature.get_bubble(
+                *content,
+                bubble_class=self.bubble_class,
+                **self.bubble_kwargs
+            )
+            if self.bubble_layout is None:
+                Group(bubble, bubble.content).shift_onto_screen()
+            else:
+                self.bubble_layout.place([(pi_creature, bubble)], self.layout_obstacles)
+
+        pi_creature.align_to_rig()
         pi_creature.generate_target()
         pi_creature.target.change_mode(self.target_mode)
         if self.look_at_arg is not None:
@@ -72,6 +221,7 @@ class RemovePiCreatureBubble(AnimationGroup):
         self.pi_creature = pi_creature
         if self.pi_creature.bubble is None:
             raise AttributeError(f"{type(pi_creature).__name__} has no bubbles")
+        self.pi_creature.align_to_rig()
         self.pi_creature.generate_target()
         self.pi_creature.target.change_mode(self.target_mode)
         if self.look_at_arg is not None:
@@ -0,0 +1,220 @@
+from __future__ import annotations
+from typing import Union, Sequence
+
+import numpy as np
+from manim import *
+from ..utils import get_unit_circle_points
+from .pi_creature import PiCreature, get_pi_creature_rig
+from .pi_creature_eyes import get_bounding_boxes, get_pupil_centers
+
+
+class CrowdModeGeometry:
+    def __init__(self, mode: str, file_name_prefix: str = "PiCreature") -> None:
+        """
+        Geometry of a mode shared by every crowd member in it. Normalized the way
+        change_mode matches modes: unit height and eyes centered at the origin.
+        Posed through the rig, so every mode has the same number of points per part.
+        """
+        creature = PiCreature(mode=mode, file_name_prefix=file_name_prefix, use_rig=False)
+        creature.set_height(1)
+        creature.shift(-creature.eyes.get_center())
+        get_pi_creature_rig(file_name_prefix).pose(creature, {mode: 1.0})
+        self.body = np.array(creature.body.points)
+        self.mouth = np.array(creature.mouth.points)
+        self.eyes = np.concatenate([eye.points for eye in creature.eyes])
+        self.eye_boxes = get_bounding_boxes(creature.eyes)
+        self.eye_bottom_y = self.eye_boxes[:, 0, 1].min()
+        self.rest_pupil_centers = np.array([pupil.get_center() for pupil in creature.pupils])
+        self.pupil_radii = creature.eye_rig.get_pupil_radii(self.eye_boxes)
+        self.dot_ratio = creature.eye_rig.pupil_dot_to_pupil_width_ratio
+
+
+_CROWD_MODE_GEOMETRIES = {}
+
+
+def get_crowd_mode_geometry(mode: str, file_name_prefix: str = "PiCreature") -> CrowdModeGeometry:
+    key = (file_name_prefix, mode)
+    if key not in _CROWD_MODE_GEOMETRIES:
+        _CROWD_MODE_GEOMETRIES[key] = CrowdModeGeometry(mode, file_name_prefix)
+    return _CROWD_MODE_GEOMETRIES[key]
+
+
+class PiCreatureCrowd(VGroup):
+    def __init__(self, positions: np.ndarray, modes: Union[str, Sequence[str]] = "plain",
+                 colors: Union[str, Sequence[str]] = BLUE, height: float = 0.5, **kwargs) -> None:
+        """
+        Many pi-creatures sharing the geometry of their modes. Per member only the eyes
+        position, height, flip, color, mode, gaze and blink are kept, in arrays, and the
+        members are drawn as one mobject per part kind, and per color for the bodies,
+        instead of one creature each. Every member keeps its place in those mobjects
+        whatever its mode, so transforms between crowd states morph member by member.
+
+        :param positions: (N, 3) array of the members' eyes centers
+        :param modes: a mode for all the members or one per member
+        :param colors: a body color for all the members or one per member
+        :param height: the height of the members
+
+        Crowd kwargs:
+           * **file_name_prefix** - the filename prefix of pi-creatures (default: "PiCreature")
+           * **flipped** - a flip flag for all the members or one per member
+        """
+        self.file_name_prefix = kwargs.pop("file_name_prefix", "PiCreature")
+        flipped = kwargs.pop("flipped", False)
+        super(PiCreatureCrowd, self).__init__(**kwargs)
+
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        n = len(self.positions)
+        self.heights = np.full(n, float(height))
+        self.flipped = np.broadcast_to(np.array(flipped, dtype=bool), (n,)).copy()
+        self.mode_names = []
+        self.modes = np.zeros(n, dtype=int)
+        self.colors = np.zeros((n, 4))
+        self.palette = []
+        self.gazes = np.zeros((n, 3))
+        self.blinks = np.zeros(n)
+        self.set_modes(modes)
+        self.set_colors(colors)
+        self.refresh()
+
+    @property
+    def num_members(self) -> int:
+        return len(self.positions)
+
+    def _get_indices(self, indices: Sequence[int] = None) -> np.ndarray:
+        return np.arange(self.num_members) if indices is None else np.asarray(indices, dtype=int)
+
+    def set_modes(self, modes: Union[str, Sequence[str]], indices: Sequence[int] = None) -> PiCreatureCrowd:
+        indices = self._get_indices(indices)
+        modes = [modes] * len(indices) if isinstance(modes, str) else list(modes)
+        for mode in modes:
+            if mode not in self.mode_names:
+                self.mode_names.append(mode)
+        self.modes[indices] = [self.mode_names.index(mode) for mode in modes]
+        return self
+
+    def set_colors(self, colors: Union[str, Sequence[str]], indices: Sequence[int] = None) -> PiCreatureCrowd:
+        indices = self._get_indices(indices)
+        colors = [colors] * len(indices) if isinstance(colors, str) else list(colors)
+        self.colors[indices] = [color_to_rgba(c) for c in colors]
+        for rgba in map(tuple, self.colors[indices]):
+            if rgba not in self.palette:
+                self.palette.append(rgba)
+        return self
+
+    def change_modes(self, modes: Union[str, Sequence[str]], indices: Sequence[int] = None) -> PiCreatureCrowd:
+        return self.set_modes(modes, indices).refresh()
+
+    def look(self, directions: np.ndarray, indices: Sequence[int] = None) -> PiCreatureCrowd:
+        indices = self._get_indices(indices)
+        directions = np.array(np.broadcast_to(directions, (len(indices), 3)), dtype=float)
+        norms = np.linalg.norm(directions, axis=1)
+        directions[norms > 0] /= norms[norms > 0, None]
+        self.gazes[indices] = directions
+        return self.refresh()
+
+    def look_at(self, point_or_mobject: Union[Mobject, np.ndarray], indices: Sequence[int] = None) -> PiCreatureCrowd:
+        if isinstance(point_or_mobject, Mobject):
+            point = point_or_mobject.get_center()
+        else:
+            point = np.array(point_or_mobject, dtype=float)
+        indices = self._get_indices(indices)
+        return self.look(point - self.positions[indices], indices)
+
+    def blink(self, indices: Sequence[int] = None, amount: float = 1.0) -> PiCreatureCrowd:
+        self.blinks[self._get_indices(indices)] = amount
+        return self.refresh()
+
+    def get_blink_animation(self, indices: Sequence[int] = None, **kwargs) -> Animation:
+        indices = self._get_indices(indices)
+
+        def update(crowd: PiCreatureCrowd, alpha: float) -> None:
+            crowd.blink(indices, there_and_back(alpha))
+
+        return UpdateFromAlphaFunc(self, update, **kwargs)
+
+    def shift(self, *vectors: np.ndarray) -> PiCreatureCrowd:
+        self.positions += sum(vectors)
+        return super(PiCreatureCrowd, self).shift(*vectors)
+
+    def scale(self, scale_factor: float, **kwargs) -> PiCreatureCrowd:
+        about_point = kwargs.get("about_point")
+        if about_point is None:
+            about_point = self.get_critical_point(kwargs.get("about_edge", ORIGIN))
+        self.positions = about_point + scale_factor * (self.positions - about_point)
+        self.heights *= scale_factor
+        return super(PiCreatureCrowd, self).scale(scale_factor, **kwargs)
+
+    def align_data(self, mobject: Mobject) -> None:
+        # .animate changes the member arrays of the target only, they are
+        # taken over here so that later refreshes draw the animated state
+        super(PiCreatureCrowd, self).align_data(mobject)
+        if isinstance(mobject, PiCreatureCrowd):
+            for name in ["positions", "heights", "flipped", "modes", "colors", "gazes", "blinks"]:
+                setattr(self, name, getattr(mobject, name).copy())
+            self.mode_names = list(mobject.mode_names)
+            self.palette = list(mobject.palette)
+
+    def _place(self, points: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """
+        Moves (n, P, 3) points from the normalized mode space to the members, flattened.
+        """
+        placed = points * self.heights[indices, None, None]
+        placed[..., 0] *= np.where(self.flipped[indices], -1, 1)[:, None]
+        placed += self.positions[indices, None]
+        return placed.reshape(-1, 3)
+
+    def _squeeze(self, points: np.ndarray, bottom_y: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        points[..., 1] += self.blinks[indices, None] * (bottom_y[:, None] - points[..., 1])
+        return points
+
+    def refresh(self) -> PiCreatureCrowd:
+        """
+        Redraws the mobjects out of the member arrays. There is a body mobject
+        per palette color holding every member, the members of other colors collapsed
+        to their eyes center, so a color change keeps the layout as well.
+        """
+        unit_circle = get_unit_circle_points()
+        geometries = [get_crowd_mode_geometry(mode, self.file_name_prefix) for mode in self.mode_names]
+
+        def stack(name: str) -> np.ndarray:
+            # Per member geometry, the modes share the point counts
+            return np.array([getattr(geometry, name) for geometry in geometries])[self.modes]
+
+        n = self.num_members
+        indices = np.arange(n)
+        eye_bottoms = stack("eye_bottom_y")
+        parts = []
+
+        bodies = self._place(stack("body"), indices).reshape(n, -1, 3)
+        for rgba in self.palette:
+            members = np.all(self.colors == rgba, axis=1)
+            body = bodies.copy()
+            body[~members] = self.positions[~members, None]
+            parts.append((body.reshape(-1, 3), rgba_to_color(rgba), rgba[3]))
+        parts.append((self._place(stack("mouth"), indices), BLACK, 1))
+
+        eyes = self._squeeze(stack("eyes").copy(), eye_bottoms, indices)
+        parts.append((self._place(eyes, indices), WHITE, 1))
+
+        # Pupils are looked in the mode space, so flipped members look the mirrored way
+        gazes = self.gazes.copy()
+        gazes[self.flipped, 0] *= -1
+        looking = np.repeat(np.linalg.norm(gazes, axis=1) > 0, 2)
+        radii = stack("pupil_radii").reshape(-1)
+        centers = get_pupil_centers(stack("eye_boxes").reshape(-1, 2, 3), np.repeat(gazes, 2, axis=0), radii)
+        centers[~looking] = stack("rest_pupil_centers").reshape(-1, 3)[~looking]
+        dot_radii = radii * np.repeat(stack("dot_ratio"), 2)
+        dot_centers = centers + (radii - dot_radii)[:, None] * normalize(UL)
+        for circle_radii, circle_centers, color in [(radii, centers, BLACK), (dot_radii, dot_centers, WHITE)]:
+            circles = unit_circle[None] * circle_radii[:, None, None] + circle_centers[:, None]
+            circles = self._squeeze(circles.reshape(n, -1, 3), eye_bottoms, indices)
+            parts.append((self._place(circles, indices), color, 1))
+
+        # The drawn mobjects are kept and written in place: the scene holds on to them
+        # while animating, e.g. a blink refreshes the crowd every frame
+        if len(self.submobjects) != len(parts):
+            self.submobjects = [VMobject(stroke_width=0) for _ in parts]
+        for submobject, (points, color, opacity) in zip(self.submobjects, parts):
+            submobject.set_points(points)
+            submobject.set_fill(color, opacity)
+        return self
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+from manim import *
+from ..utils import get_unit_circle_points
+
+
+class EyeRig:
+    def __init__(self, pupil_to_eye_width_ratio: float = 0.4, pupil_dot_to_pupil_width_ratio: float = 0.3) -> None:
+        """
+        Parametric state of pi-creature's eyes. The eye ellipses are read off the eye outlines,
+        the pupils and their dots are generated from the shared unit circle out of the ratios
+        and the gaze, so looking somewhere never queries or rebuilds pupil mobjects.
+
+        :param pupil_to_eye_width_ratio: the ratio of pupil towards eye
+        :param pupil_dot_to_pupil_width_ratio: the ratio of pupil' dot towards pupil
+        """
+        self.pupil_to_eye_width_ratio = pupil_to_eye_width_ratio
+        self.pupil_dot_to_pupil_width_ratio = pupil_dot_to_pupil_width_ratio
+        self.gaze = None  # type: Optional[np.ndarray]
+
+    def get_pupil_radii(self, eye_boxes: np.ndarray) -> np.ndarray:
+        return self.pupil_to_eye_width_ratio * (eye_boxes[:, 1, 0] - eye_boxes[:, 0, 0]) / 2
+
+
+def get_bounding_boxes(mobjects: list) -> np.ndarray:
+    """
+    Bounding boxes of many mobjects in one pass, as an (N, 2, 3) array of min and max corners.
+    """
+    points = [mobject.get_all_points() for mobject in mobjects]
+    starts = np.cumsum([0] + [len(p) for p in points[:-1]])
+    stacked = np.concatenate(points)
+    return np.stack([
+        np.minimum.reduceat(stacked, starts),
+        np.maximum.reduceat(stacked, starts)
+    ], axis=1)
+
+
+def get_pupil_centers(eye_boxes: np.ndarray, directions: np.ndarray, pupil_radii: np.ndarray) -> np.ndarray:
+    """
+    Pupil centers of eye pairs looking in the unit directions, one direction per eye.
+    A pupil goes towards the eye boundary, minus 3/4 of its radius, and the right
+    pupil of a pair is aligned to the bottom of the left one.
+    """
+    eye_centers = eye_boxes.mean(axis=1)
+    eye_radii = (eye_boxes[:, 1] - eye_boxes[:, 0]) / 2
+    vects = np.zeros_like(eye_centers)
+    vects[:, :2] = directions[:, :2] * eye_radii[:, :2]
+    v_norms = np.linalg.norm(vects, axis=1)
+    factors = np.divide(v_norms - 0.75 * pupil_radii, v_norms, out=np.zeros_like(v_norms), where=v_norms > 0)
+    centers = eye_centers + factors[:, None] * vects
+    bottoms = centers[:, 1] - pupil_radii
+    centers[1::2, 1] += bottoms[0::2] - bottoms[1::2]
+    return centers
+
+
+def render_pupils(pupils: list, centers: np.ndarray, radii: np.ndarray, dot_ratios: np.ndarray,
+                  flipped: np.ndarray = None) -> None:
+    """
+    Generates pupils and their dots from the unit circle, the dot sits in the upper left
+    of a pupil, in the upper right for the pupils of flipped creatures.
+    """
+    unit_circle = get_unit_circle_points()
+    dot_radii = radii * dot_ratios
+    dot_directions = np.tile(normalize(UL), (len(centers), 1))
+    if flipped is not None:
+        dot_directions[flipped, 0] *= -1
+    dot_centers = centers + (radii - dot_radii)[:, None] * dot_directions
+    pupil_points = unit_circle[None] * radii[:, None, None] + centers[:, None]
+    dot_points = unit_circle[None] * dot_radii[:, None, None] + dot_centers[:, None]
+    for pupil, p_points, d_points in zip(pupils, pupil_points, dot_points):
+        if len(pupil.submobjects) == 0:
+            pupil.add(VMobject(fill_color=WHITE, fill_opacity=1, stroke_width=0))
+        pupil.set_points(p_points)
+        pupil.submobjects[0].set_points(d_points)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+from manim import *
+from .pi_creature import (
+    PiCreature, get_all_pi_creature_modes, get_pi_creature_rig,
+    LEFT_EYE_INDEX, RIGHT_EYE_INDEX, LEFT_PUPIL_INDEX, RIGHT_PUPIL_INDEX, BODY_INDEX, MOUTH_INDEX
+)
+
+
+class PiCreatureModeIndex:
+    def __init__(self, file_name_prefix: str = "PiCreature") -> None:
+        """
+        Index of pi-creature modes found in the svgs directory. Every mode is checked
+        to have the part layout PiCreature.name_parts relies on before it gets used.
+
+        :param file_name_prefix: the filename prefix of the svgs
+        """
+        self.file_name_prefix = file_name_prefix
+        self._modes = None
+        self.problems = {}  # type: Dict[str, List[str]]
+
+    @property
+    def modes(self) -> List[str]:
+        # The directory is scanned on the first use only
+        if self._modes is None:
+            self._modes = sorted(get_all_pi_creature_modes(self.file_name_prefix))
+        return self._modes
+
+    def is_valid(self, mode: str) -> bool:
+        if mode not in self.problems:
+            self.validate(mode)
+        return len(self.problems[mode]) == 0
+
+    def validate(self, mode: str, **pi_creature_kwargs) -> List[str]:
+        """
+        Parses the mode, which also puts it into PI_CREATURE_TEMPLATES, and returns its layout problems.
+        """
+        if mode not in self.modes:
+            self.problems[mode] = [f"there is no {self.file_name_prefix}_{mode}.svg"]
+            return self.problems[mode]
+        try:
+            pi_creature = PiCreature(mode=mode, file_name_prefix=self.file_name_prefix,
+                                     use_rig=False, **pi_creature_kwargs)
+        except IndexError:
+            self.problems[mode] = [f"has less than {MOUTH_INDEX + 1} parts"]
+            return self.problems[mode]
+
+        self.problems[mode] = self.get_layout_problems(pi_creature)
+        return self.problems[mode]
+
+    def get_layout_problems(self, pi_creature: PiCreature) -> List[str]:
+        """
+        Checks the parts of an unflipped creature against the layout name_parts relies on.
+        The drawings put the eyes on top of the body and tilt the head, so the containment
+        checks compare part centers with boxes widened by a tolerance.
+        """
+        problems = []
+        if len(pi_creature.submobjects) != MOUTH_INDEX + 1:
+            problems.append(f"has {len(pi_creature.submobjects)} parts instead of {MOUTH_INDEX + 1}")
+        for index, part in enumerate(pi_creature.submobjects[:MOUTH_INDEX + 1]):
+            if len(part.family_members_with_points()) == 0:
+                problems.append(f"part {index} has no path")
+        if len(problems) > 0:
+            return problems
+
+        boxes = [np.array([part.get_corner(DL), part.get_corner(UR)])[:, :2] for part in pi_creature.submobjects]
+        centers = [box.mean(axis=0) for box in boxes]
+        sizes = [box[1] - box[0] for box in boxes]
+        body_height = sizes[BODY_INDEX][1]
+        eye_height = np.mean([sizes[index][1] for index in [LEFT_EYE_INDEX, RIGHT_EYE_INDEX]])
+
+        def is_inside(center: np.ndarray, box: np.ndarray, margin: float) -> bool:
+            return bool(np.all(box[0] - margin <= center) and np.all(center <= box[1] + margin))
+
+        # The thinnest shipped part, a closed mouth, is about 1% of the body height
+        for index, size in enumerate(sizes):
+            if np.any(size <= 0.002 * body_height):
+                problems.append(f"part {index} is degenerate")
+        if centers[LEFT_EYE_INDEX][0] >= centers[RIGHT_EYE_INDEX][0]:
+            problems.append("the left eye is not left of the right eye")
+        for eye_index, pupil_index in [(LEFT_EYE_INDEX, LEFT_PUPIL_INDEX), (RIGHT_EYE_INDEX, RIGHT_PUPIL_INDEX)]:
+            if not is_inside(centers[pupil_index], boxes[eye_index], 0.25 * sizes[eye_index][0]):
+                problems.append(f"pupil {pupil_index} is outside its eye")
+        # Eye centers sit up to half an eye height above the body box
+        for eye_index in [LEFT_EYE_INDEX, RIGHT_EYE_INDEX]:
+            if not is_inside(centers[eye_index], boxes[BODY_INDEX], eye_height):
+                problems.append(f"eye {eye_index} is away from the body")
+        if not is_inside(centers[MOUTH_INDEX], boxes[BODY_INDEX], 0):
+            problems.append("the mouth is outside the body")
+        # The mouth may rise up to half the eye height, as in thinking
+        eye_center_y = np.mean([centers[index][1] for index in [LEFT_EYE_INDEX, RIGHT_EYE_INDEX]])
+        if centers[MOUTH_INDEX][1] > eye_center_y + eye_height / 2:
+            problems.append("the mouth is above the eyes")
+        return problems
+
+    def validate_all(self) -> Dict[str, List[str]]:
+        for mode in self.modes:
+            self.validate(mode)
+        return {mode: problems for mode, problems in self.problems.items() if len(problems) > 0}
+
+    def warm_up(self, modes: List[str] = None, max_workers: int = None, build_rig: bool = True,
+                **pi_creature_kwargs) -> List[str]:
+        """
+        Parses and validates the modes on a thread pool, so that the first use of a mode
+        in the middle of a scene is a template cache hit. Returns the valid modes.
+
+        :param modes: modes to warm up (default: all the indexed modes)
+        :param max_workers: the thread pool size
+        :param build_rig: build the blendshape rig from the warmed templates as well
+        :param pi_creature_kwargs: the style the templates are built with
+        """
+        modes = self.modes if modes is None else modes
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            problems = list(pool.map(lambda mode: self.validate(mode, **pi_creature_kwargs), modes))
+        valid_modes = []
+        for mode, mode_problems in zip(modes, problems):
+            if len(mode_problems) > 0:
+                logger.warning(f"{self.file_name_prefix} mode '{mode}': " + "; ".join(mode_problems))
+            else:
+                valid_modes.append(mode)
+        if build_rig:
+            get_pi_creature_rig(self.file_name_prefix)
+        return valid_modes
+
+
+_PI_CREATURE_MODE_INDICES = {}
+
+
+def get_pi_creature_mode_index(file_name_prefix: str = "PiCreature") -> PiCreatureModeIndex:
+    if file_name_prefix not in _PI_CREATURE_MODE_INDICES:
+        _PI_CREATURE_MODE_INDICES[file_name_prefix] = PiCreatureModeIndex(file_name_prefix)
+    return _PI_CREATURE_MODE_INDICES[file_name_prefix]
@@ -1,33 +1,63 @@
 from __future__ import annotations
-import random
+import weakref
+from pathlib import Path
 from typing import Optional
 
 import numpy as np
 
 from .pi_creature_animations import *
-from custom.utils import Singleton
+from .pi_creature_modes import get_pi_creature_mode_index
+from .pi_creature_crowd import PiCreatureCrowd
+from .bubble_layout import BubbleLayout
+from ..animations import apply_points_function
+from ..utils import SceneRandom
+from ..scene_registry import SCENE_REGISTRY
 
 
-class PiCreatureScene(Scene, metaclass=Singleton):
+class PiCreatureScene(Scene):
     def __init__(self, **kwargs) -> None:
         self.total_wait_time = kwargs.get("total_wait_time", 0)
         self.seconds_to_blink = kwargs.get("seconds_to_blink", 3)
         self.pi_creatures_start_on_screen = kwargs.get("pi_creatures_start_on_screen", True)
+        self.warm_up_modes = kwargs.get("warm_up_modes", None)
         self.default_pi_creature_kwargs = {
             "color": BLUE,
             "flip_at_start": False,
         }
         self.default_pi_creature_start_corner = kwargs.get("default_pi_creature_start_corner", DL)
+        self.bubble_layout = kwargs.get("bubble_layout", BubbleLayout())
         self.pi_creatures = None  # type: VGroup[PiCreature]
         self.pi_creature = None  # type: PiCreature
+        # Mobject -> creatures in its family or owning it, kept up to date by add and remove
+        self.pi_creature_index = weakref.WeakKeyDictionary()
+        # Kept up to date by add, remove and clear, which play calls for the mobjects its animations
+        # add and remove. Creatures put into groups already on screen need rescan_on_screen_pi_creatures
+        self.on_screen_pi_creatures = set()
+        self.scene_random = SceneRandom(type(self).__name__, kwargs.get("random_seed", None))
         super(PiCreatureScene, self).__init__()
 
     def setup(self) -> None:
         self.pi_creatures = VGroup(*self.create_pi_creatures())
+        self.warm_up_pi_creatures()
         self.pi_creature = self.get_primary_pi_creature()
+        self.rescan_on_screen_pi_creatures()
         if self.pi_creatures_start_on_screen:
             self.add(*self.pi_creatures)
 
+    def warm_up_pi_creatures(self) -> None:
+        """
+        Parses the modes up front in the styles of the scene's creatures, so that none
+        of them stalls the render on its first use. Off with warm_up_modes=[].
+        """
+        if self.warm_up_modes is not None and len(self.warm_up_modes) == 0:
+            return
+        styles = {}
+        for pi in self.get_pi_creatures():
+            key = pi.get_template_key(pi.mode, pi.svg_kwargs)
+            styles[(pi.file_name_prefix, key[2])] = pi
+        for (file_name_prefix, _), pi in styles.items():
+            get_pi_creature_mode_index(file_name_prefix).warm_up(self.warm_up_modes, **pi.get_style_kwargs())
+
     def create_pi_creatures(self) -> VGroup:
         """
         Likely updated for subclasses
@@ -46,15 +76,82 @@ class PiCreatureScene(Scene, metaclass=Singleton):
         return self.pi_creatures[0]
 
     def any_pi_creatures_on_screen(self) -> bool:
-        return len(self.get_on_screen_pi_creatures()) > 0
+        return len(self.get_on_screen_pi_creature_set()) > 0
 
     def get_on_screen_pi_creatures(self) -> VGroup:
-        mobjects = self.get_mobject_family_members()
+        on_screen_pi_creatures = self.get_on_screen_pi_creature_set()
         return VGroup(*[
             pi for pi in self.get_pi_creatures()
-            if pi in mobjects
+            if pi in on_screen_pi_creatures
         ])
 
+    def get_on_screen_pi_creature_set(self) -> set:
+        return self.on_screen_pi_creatures
+
+    def rescan_on_screen_pi_creatures(self) -> None:
+        """
+        Rebuilds the on-screen creatures from the whole scene, for changes made past add and remove.
+        """
+        mobjects = set(self.get_mobject_family_members())
+        self.on_screen_pi_creatures = {pi for pi in self.get_pi_creatures() or [] if pi in mobjects}
+
+    def add(self, *mobjects: Mobject) -> PiCreatureScene:
+        super(PiCreatureScene, self).add(*mobjects)
+        self.on_screen_pi_creatures.update(self.index_pi_creatures(*mobjects))
+        return self
+
+    def remove(self, *mobjects: Mobject) -> PiCreatureScene:
+        super(PiCreatureScene, self).remove(*mobjects)
+        removed = set()
+        for mobject in mobjects:
+            for member in mobject.get_family():
+                removed.update(self.pi_creature_index.pop(member, ()))
+        # A creature may still be on screen through another mobject, which only a rescan tells
+        if removed & self.on_screen_pi_creatures:
+            self.rescan_on_screen_pi_creatures()
+        return self
+
+    def clear(self) -> PiCreatureScene:
+        super(PiCreatureScene, self).clear()
+        self.on_screen_pi_creatures = set()
+        return self
+
+    def bring_to_back(self, *mobjects: Mobject) -> PiCreatureScene:
+        # Removes the mobjects and puts them back into self.mobjects past add
+        super(PiCreatureScene, self).bring_to_back(*mobjects)
+        self.on_screen_pi_creatures.update(self.index_pi_creatures(*mobjects))
+        return self
+
+    def index_pi_creatures(self, *mobjects: Mobject, owners: frozenset = frozenset()) -> frozenset:
+        """
+        Records for every family member of the mobjects the creatures it contains
+        or is a part of, in one walk over the families.
+
+        :param owners: the creatures the mobjects are parts of
+        :return: the creatures in the families of the mobjects
+        """
+        pi_creatures = set(self.get_pi_creatures() or [])
+
+        def index(mobject: Mobject, owners: frozenset) -> frozenset:
+            if mobject in pi_creatures:
+                owners = owners | {mobject}
+            related = owners.union(*[index(submobject, owners) for submobject in mobject.submobjects])
+            self.pi_creature_index[mobject] = related
+            return related
+
+        return frozenset().union(*[index(mobject, owners) for mobject in mobjects])
+
+    def get_related_pi_creatures(self, mobject: Mobject) -> frozenset:
+        """
+        Creatures in the family of the mobject or owning it. Only a mobject missing from
+        the index is walked, add and remove keep the rest of it up to date.
+        """
+        if mobject not in self.pi_creature_index:
+            # Mode changes give a creature new parts, they are found among the creature families
+            owners = frozenset(pi for pi in self.get_pi_creatures() or [] if mobject in pi.get_family())
+            self.index_pi_creatures(mobject, owners=owners)
+        return self.pi_creature_index[mobject]
+
     def introduce_bubble(self, *args, **kwargs) -> None:
         if isinstance(args[0], PiCreature):
             pi_creature = args[0]
@@ -83,16 +180,29 @@ class PiCreatureScene(Scene, metaclass=Singleton):
         if pi_creature in pi_creatures_with_bubbles:
             pi_creatures_with_bubbles.remove(pi_creature)
             old_bubble = pi_creature.bubble
-            bubble = pi_creature.get_bubble(
-                *content,
-                bubble_class=bubble_class,
-                **bubble_kwargs
-            )
-            anims += [
-                ReplacementTransform(old_bubble, bubble),
-                ReplacementTransform(old_bubble.content, bubble.content),
-                pi_creature.change_mode, target_mode
-            ]
+            old_content = old_bubble.content
+            if old_bubble.can_refit(bubble_class, bubble_kwargs):
+                # Same kind of bubble, only the content changes and the outline is stretched to it
+                new_content = pi_creature.get_bubble_content(content[0])
+                old_bubble.generate_target()
+                old_bubble.target.refit_to_content(new_content)
+                old_bubble.content = new_content
+                anims += [
+                    MoveToTarget(old_bubble),
+                    ReplacementTransform(old_content, new_content),
+                ]
+            else:
+                bubble = pi_creature.get_bubble(
+                    *content,
+                    bubble_class=bubble_class,
+                    **bubble_kwargs
+                )
+                anims += [
+                    ReplacementTransform(old_bubble, bubble),
+                    ReplacementTransform(old_content, bubble.content),
+                ]
+            pi_creature.align_to_rig()
+            anims.append(pi_creature.animate.change_mode(target_mode))
         else:
             anims.append(PiCreatureBubbleIntroduction(
                 pi_creature,
@@ -100,6 +210,8 @@ class PiCreatureScene(Scene, metaclass=Singleton):
                 bubble_class=bubble_class,
                 bubble_kwargs=bubble_kwargs,
                 target_mode=target_mode,
+                bubble_layout=self.bubble_layout,
+                layout_obstacles=[pi for pi in self.get_on_screen_pi_creatures() if pi is not pi_creature],
                 **kwargs
             ))
         anims += [
@@ -110,6 +222,41 @@ class PiCreatureScene(Scene, metaclass=Singleton):
 
         self.play(*anims, **kwargs)
 
+    def introduce_bubbles(self, *lines, **kwargs) -> None:
+        """
+        Several creatures speak or think at once. The bubbles are laid out
+        together, clear of each other and of the creatures on screen.
+
+        :param lines: (pi_creature, *content) tuples
+        """
+        bubble_class = kwargs.pop("bubble_class", SpeechBubble)
+        target_mode = kwargs.pop(
+            "target_mode",
+            "thinking" if bubble_class is ThoughtBubble else "speaking"
+        )
+        bubble_kwargs = kwargs.pop("bubble_kwargs", {})
+        bubble_removal_kwargs = kwargs.pop("bubble_removal_kwargs", {})
+        added_anims = kwargs.pop("added_anims", [])
+
+        speakers = [line[0] for line in lines]
+        on_screen_mobjects = self.get_mobject_family_members()
+        anims = [
+            RemovePiCreatureBubble(pi, **bubble_removal_kwargs)
+            for pi in self.get_pi_creatures()
+            if pi not in speakers and pi.bubble is not None and pi.bubble in on_screen_mobjects
+        ]
+        bubbles = [
+            (pi, pi.get_bubble(*content, bubble_class=bubble_class, **bubble_kwargs))
+            for pi, *content in lines
+        ]
+        self.bubble_layout.place(bubbles, [pi for pi in self.get_on_screen_pi_creatures() if pi not in speakers])
+        anims += [
+            PiCreatureBubbleIntroduction(pi, bubble=bubble, bubble_class=bubble_class, target_mode=target_mode)
+            for pi, bubble in bubbles
+        ]
+        anims += added_anims
+        self.play(*anims, **kwargs)
+
     def pi_creature_says(self, *args, **kwargs) -> None:
         self.introduce_bubble(
             *args,
@@ -130,22 +277,59 @@ class PiCreatureScene(Scene, metaclass=Singleton):
     def think(self, *content, **kwargs) -> None:
         self.pi_creature_thinks(self.get_primary_pi_creature(), *content, **kwargs)
 
+    def get_on_screen_group_members(self, animation: Animation, on_screen_mobjects: set) -> list:
+        """
+        Members of the group of an animation marked with leaves_group_out_of_scene, as CrowdBlink,
+        when the group is not on screen itself but all of its members are. Empty for any other animation.
+        """
+        mobject = animation.mobject
+        if not getattr(animation, "leaves_group_out_of_scene", False) or mobject in on_screen_mobjects:
+            return []
+        members = mobject.submobjects
+        if len(members) == 0 or not all(member in on_screen_mobjects for member in members):
+            return []
+        return members
+
+    def add_mobjects_from_animations(self, animations: list) -> None:
+        # Adding a group of mobjects already on screen would draw them once more on top of
+        # everything, so such groups stay out of the scene and get_moving_mobjects uses their members
+        on_screen_mobjects = set(self.get_mobject_family_members())
+        super(PiCreatureScene, self).add_mobjects_from_animations([
+            anim for anim in animations
+            if len(self.get_on_screen_group_members(anim, on_screen_mobjects)) == 0
+        ])
+
+    def get_moving_mobjects(self, *animations: Animation) -> list:
+        moving_mobjects = super(PiCreatureScene, self).get_moving_mobjects(*animations)
+        mobjects = self.get_mobject_family_members()
+        on_screen_mobjects = set(mobjects)
+        group_members = {
+            member for anim in animations
+            for member in self.get_on_screen_group_members(anim, on_screen_mobjects)
+        }
+        if len(group_members) == 0:
+            return moving_mobjects
+        for i, mobject in enumerate(mobjects[:len(mobjects) - len(moving_mobjects)]):
+            if mobject in group_members:
+                return mobjects[i:]
+        return moving_mobjects
+
     def compile_animations(self, *args, **kwargs):
         """
         Add animations so that all pi creatures look at the
         first mobject being animated with each .play call
         """
         animations = Scene.compile_animations(self, *args, **kwargs)
-        anim_mobjects = Group(*[a.mobject for a in animations])
-        all_movers = anim_mobjects.get_family()
         if not self.any_pi_creatures_on_screen():
             return animations
 
         pi_creatures = self.get_on_screen_pi_creatures()
+        on_screen = set(pi_creatures)
+        animated_pi_creatures = [self.get_related_pi_creatures(anim.mobject) & on_screen for anim in animations]
         non_pi_creature_anims = [
             anim
-            for anim in animations
-            if len(set(anim.mobject.get_family()).intersection(pi_creatures)) == 0
+            for anim, animated in zip(animations, animated_pi_creatures)
+            if len(animated) == 0
         ]
         if len(non_pi_creature_anims) == 0:
             return animations
@@ -153,55 +337,73 @@ class PiCreatureScene(Scene, metaclass=Singleton):
         # is being animated
         first_anim = non_pi_creature_anims[0]
         main_mobject = first_anim.mobject
-        for pi_creature in pi_creatures:
-            if pi_creature not in all_movers:
-                animations.append(ApplyMethod(
-                    pi_creature.look_at,
-                    main_mobject,
-                ))
+        all_movers = frozenset().union(*animated_pi_creatures)
+        lookers = [pi for pi in pi_creatures if pi not in all_movers]
+        for pi_creature in lookers:
+            pi_creature.generate_target()
+        look_at_many([pi.target for pi in lookers], main_mobject)
+        animations += [MoveToTarget(pi) for pi in lookers]
         return animations
 
     def blink(self) -> None:
-        self.play(Blink(random.choice(self.get_on_screen_pi_creatures())))
+        self.play(Blink(self.scene_random.choice(self.get_on_screen_pi_creatures(), "blink")))
 
     def joint_blink(self, pi_creatures: PiCreature = None, shuffle: bool = True, **kwargs) -> PiCreatureScene:
         if pi_creatures is None:
             pi_creatures = self.get_on_screen_pi_creatures()
         creatures_list = list(pi_creatures)
         if shuffle:
-            random.shuffle(creatures_list)
-
-        def get_rate_func(pi):
-            index = creatures_list.index(pi)
-            proportion = float(index) / len(creatures_list)
-            start_time = 0.8 * proportion
-            return squish_rate_func(
-                there_and_back,
-                start_time, start_time + 0.2
-            )
+            self.scene_random.shuffle(creatures_list, "blink")
 
-        self.play(*[
-            Blink(pi, rate_func=get_rate_func(pi), **kwargs)
-            for pi in creatures_list
-        ])
+        self.play(CrowdBlink(creatures_list, **kwargs))
         return self
 
     def wait(self, _time: int = 1, blink: bool = True, **kwargs) -> Optional[PiCreatureScene, None]:
-        if "stop_condition" in kwargs:
-            self.non_blink_wait(_time, **kwargs)
-            return
-        while _time >= 1:
-            time_to_blink = self.total_wait_time % self.seconds_to_blink == 0
-            if blink and self.any_pi_creatures_on_screen() and time_to_blink:
-                self.blink()
-            else:
-                self.non_blink_wait(**kwargs)
-            _time -= 1
-            self.total_wait_time += 1
-        if _time > 0:
+        if len(kwargs) > 0:
+            # Scene.wait options, such as stop_condition, make a plain wait: a wait that stops
+            # early or holds a frozen frame has no room for planned blinks
             self.non_blink_wait(_time, **kwargs)
+            return self
+        # The blinks of the whole wait are planned up front and played as one segment,
+        # each creature running a single Blink over all of its blink windows
+        whole_seconds = int(_time)
+        blink_seconds = [
+            second for second in range(whole_seconds)
+            if (self.total_wait_time + second) % self.seconds_to_blink == 0
+        ]
+        self.total_wait_time += whole_seconds
+        if not (blink and blink_seconds and self.any_pi_creatures_on_screen()):
+            self.non_blink_wait(_time)
+            return self
+
+        blink_windows = {}
+        pi_creatures = self.get_on_screen_pi_creatures()
+        for second in blink_seconds:
+            # Where Blink's default squish puts a one second blink
+            blink_windows.setdefault(self.scene_random.choice(pi_creatures, "blink"), []).append(
+                ((second + 0.4) / _time, (second + 0.6) / _time)
+            )
+        self.play(*[
+            Blink(pi, rate_func=squish_windows_rate_func(there_and_back, windows))
+            for pi, windows in blink_windows.items()
+        ], run_time=_time)
         return self
 
+    def render(self, preview: bool = False) -> None:
+        # Rendered by the manim cli too, the registry releases the scene once it's done
+        SCENE_REGISTRY.begin(self)
+        try:
+            super(PiCreatureScene, self).render(preview)
+        finally:
+            SCENE_REGISTRY.end(self)
+
+    def tear_down(self) -> None:
+        super(PiCreatureScene, self).tear_down()
+        # The seed goes next to the movie, to reproduce the render
+        movie_file_path = getattr(self.renderer.file_writer, "movie_file_path", None)
+        if movie_file_path:
+            self.scene_random.save(str(Path(movie_file_path).with_suffix(".seed.json")))
+
     def non_blink_wait(self, duration_time: int = 1, **kwargs) -> PiCreatureScene:
         Scene.wait(self, duration_time, **kwargs)
         return self
@@ -260,8 +462,7 @@ class TeacherStudentsScene(PiCreatureScene):
         self.students.scale(self.student_scale_factor)
         self.students.to_corner(DOWN + LEFT)
         self.teacher.look_at(self.students[-1].eyes)
-        for student in self.students:
-            student.look_at(self.teacher.eyes)
+        look_at_many(self.students, self.teacher.eyes)
 
         return [self.teacher] + list(self.students)
 
@@ -278,10 +479,10 @@ class TeacherStudentsScene(PiCreatureScene):
 
     def student_says(self, *content, **kwargs):
         if "target_mode" not in kwargs:
-            target_mode = random.choice([
+            target_mode = self.scene_random.choice([
                 "raise_right_hand",
                 "raise_left_hand",
-            ])
+            ], "hands")
             kwargs["target_mode"] = target_mode
         if "bubble_kwargs" not in kwargs:
             kwargs["bubble_kwargs"] = {"direction": LEFT}
@@ -342,13 +543,10 @@ class TeacherStudentsScene(PiCreatureScene):
                 raise Exception("No pi creatures have a thought bubble")
         vect = -bubble.get_bubble_center()
 
-        def func(point):
-            centered = point + vect
-            return radius * centered / np.linalg.norm(centered)
-        self.play(*[
-            ApplyPointwiseFunction(func, mob)
-            for mob in self.mobjects
-        ])
+        def func(points):
+            centered = points + vect
+            return radius * centered / np.linalg.norm(centered, axis=1, keepdims=True)
+        self.play(*apply_points_function(func, *self.mobjects))
 
 
 class CustomersScene(PiCreatureScene):
@@ -381,8 +579,7 @@ class CustomersScene(PiCreatureScene):
         self.customers.arrange(DOWN, buff=LARGE_BUFF*1.5)
         self.customers.scale(self.customers_scale_factor)
         self.customers.to_edge(LEFT)
-        for customer in self.customers:
-            customer.look_at([0, 0, 0])
+        look_at_many(self.customers, ORIGIN)
 
         return list(self.customers)
 
@@ -416,3 +613,54 @@ class CustomersScene(PiCreatureScene):
             lag_ratio=kwargs.get("lag_ratio", 0.5),
             run_time=1,
         )
+
+
+class CrowdScene(PiCreatureScene):
+    def __init__(self, **kwargs):
+        self.crowd_size = kwargs.pop("crowd_size", 200)
+        self.crowd_colors = [BLUE_D, BLUE_E, BLUE_C, BLUE_B]
+        self.crowd_height = 0.35
+        self.crowd_buff = 0.15
+        self.background_color = BLACK
+        self.seconds_to_blink = 2
+        self.background = None
+        self.crowd = None
+        super(CrowdScene, self).__init__(**kwargs)
+        self.pi_creatures_start_on_screen = False
+
+    def setup(self):
+        self.background = FullScreenFadeRectangle(
+            fill_color=self.background_color,
+            fill_opacity=1,
+        )
+        self.add(self.background)
+        PiCreatureScene.setup(self)
+        self.crowd = self.create_crowd()
+        self.add(self.crowd)
+
+    def create_crowd(self):
+        """
+        Likely updated for subclasses
+        """
+        step = self.crowd_height + self.crowd_buff
+        n_cols = max(int((config.frame_width / 2) / step), 1)
+        rows, cols = np.divmod(np.arange(self.crowd_size), n_cols)
+        positions = np.zeros((self.crowd_size, 3))
+        positions[:, 0] = -config.frame_x_radius + step * (cols + 0.5)
+        positions[:, 1] = config.frame_y_radius - step * (rows + 0.5)
+        colors = [self.crowd_colors[i % len(self.crowd_colors)] for i in range(self.crowd_size)]
+        crowd = PiCreatureCrowd(positions, colors=colors, height=self.crowd_height)
+        crowd.look_at(ORIGIN)
+        return crowd
+
+    def get_crowd(self):
+        return self.crowd
+
+    def change_crowd_modes(self, modes, indices=None, **kwargs):
+        self.play(self.crowd.animate.change_modes(modes, indices), **kwargs)
+
+    def crowd_look_at(self, thing_to_look_at, indices=None, **kwargs):
+        self.play(self.crowd.animate.look_at(thing_to_look_at, indices), **kwargs)
+
+    def crowd_blink(self, indices=None, **kwargs):
+        self.play(self.crowd.get_blink_animation(indices, **kwargs))
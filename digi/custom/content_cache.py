@@ -0,0 +1,35 @@
+"""
+LRU cache of text content mobjects.
+
+Pango and LaTeX layout is a large share of scene construction, and the same strings
+are built over and over. cached_text, cached_tex and cached_math_tex key the built
+mobject by its class, strings and keyword arguments (font, size, t2c map...) and hand
+out copies sharing the cached buffers copy-on-write.
+"""
+from __future__ import annotations
+
+from manim import *
+from .utils import TemplateCache, freeze
+from .shared_arrays import copy_on_write
+
+CONTENT_CACHE = TemplateCache(max_size=1024, max_bytes=256 * 1024 ** 2)
+
+
+def get_cached_content(mobject_class: type, *strings: str, **kwargs) -> Mobject:
+    key = (mobject_class.__name__, strings, freeze(kwargs))
+    template = CONTENT_CACHE.get(key)
+    if template is None:
+        template = CONTENT_CACHE.put(key, mobject_class(*strings, **kwargs))
+    return copy_on_write(template)
+
+
+def cached_text(text: str, **kwargs) -> Text:
+    return get_cached_content(Text, text, **kwargs)
+
+
+def cached_tex(*tex_strings: str, **kwargs) -> Tex:
+    return get_cached_content(Tex, *tex_strings, **kwargs)
+
+
+def cached_math_tex(*tex_strings: str, **kwargs) -> MathTex:
+    return get_cached_content(MathTex, *tex_strings, **kwargs)
@@ -3,11 +3,20 @@ from abc import ABC
 import numpy as np
 from manim import *
 from pathlib import Path
-from .utils import parent_kwargs
-from typing import Union, Optional, Callable
+from .utils import parent_kwargs, TemplateCache, freeze, get_unit_circle_points
+from .assets import CompiledSVGMobject
+from .shared_arrays import copy_on_write, share_buffer
+from typing import Union, Optional, Callable, Tuple, Iterable
 
+# Normalized bubbles keyed by (class, file, direction, style), new bubbles are cloned from them
+BUBBLE_TEMPLATES = TemplateCache(max_size=32)
+# Finished icons keyed by (class, arguments), new icons are cloned from them
+ICON_TEMPLATES = TemplateCache(max_size=64)
+# Adaptively sampled curves keyed by (function, range, sampling options)
+FUNCTION_SAMPLES = TemplateCache(max_size=128)
 
-class Bubble(SVGMobject, ABC):
+
+class Bubble(CompiledSVGMobject, ABC):
 
     def __init__(self, **kwargs):
         self.direction_was_specified = ("direction" in kwargs)
@@ -21,20 +30,68 @@ class Bubble(SVGMobject, ABC):
         if self.file_name is None:
             raise Exception("Must invoke Bubble subclass")
 
-        super(Bubble, self).__init__(self.file_name, **parent_kwargs(self, **kwargs))
-
-        self.center()
-        self.stretch_to_fit_height(self.height)
-        self.stretch_to_fit_width(self.width)
-        if self.direction[0] > 0:
-            self.flip()
+        svg_kwargs = parent_kwargs(self, **kwargs)
+        template_key = (
+            type(self).__name__, self.file_name, tuple(self.direction),
+            tuple((key, str(value)) for key, value in sorted(svg_kwargs.items()))
+        )
+        self.template = BUBBLE_TEMPLATES.get(template_key)
+        super(Bubble, self).__init__(self.file_name, **svg_kwargs)
+
+        if self.template is None:
+            self.center()
+            self.stretch_to_fit_height(self.height)
+            self.stretch_to_fit_width(self.width)
+            if self.direction[0] > 0:
+                self.flip()
+            self.arrange_parts()
+            if config.renderer == "opengl":
+                self.refresh_triangulation()
+            BUBBLE_TEMPLATES.put(template_key, copy_on_write(self))
+        else:
+            self.direction = np.array(self.template.direction)
+        self.template = None
         self.content = Mobject()
-        if config.renderer == "opengl":
-            self.refresh_triangulation()
+
+    def generate_points(self) -> None:
+        if self.template is None:
+            super(Bubble, self).generate_points()
+        else:
+            self.add(*copy_on_write(self.template).submobjects)
+
+    def arrange_parts(self) -> None:
+        """
+        Final touch of a freshly parsed bubble, the result goes into the template
+        """
+        pass
+
+    def get_box(self) -> Tuple[np.ndarray, np.ndarray]:
+        points = self.get_all_points()
+        return points.min(axis=0), points.max(axis=0)
+
+    def get_tip_of_box(self, box: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        # The corner towards DOWN + direction, as get_corner gives it
+        mins, maxs = box
+        corner = (mins + maxs) / 2
+        vect = DOWN + self.direction
+        corner[vect > 0] = maxs[vect > 0]
+        corner[vect < 0] = mins[vect < 0]
+        return corner - 0.6 * self.direction
 
     def get_tip(self) -> np.ndarray:
         # TODO, find a better way
-        return self.get_corner(DOWN + self.direction) - 0.6 * self.direction
+        return self.get_tip_of_box(self.get_box())
+
+    def apply_affine(self, scale: np.ndarray, shift: np.ndarray, about_point: np.ndarray) -> SVGMobject:
+        """
+        Scales the bubble per axis about a point and shifts it, in one pass over its points.
+        """
+        for mob in self.family_members_with_points():
+            mob.points = about_point + scale * (mob.points - about_point) + shift
+        if config.renderer == "opengl":
+            self.refresh_unit_normal()
+            self.refresh_triangulation()
+        return self
 
     def get_bubble_center(self):
         factor = self.bubble_center_adjustment_factor
@@ -60,14 +117,22 @@ class Bubble(SVGMobject, ABC):
         mob_center = mobject.get_center()
         want_to_flip = np.sign(mob_center[0]) != np.sign(self.direction[0])
         can_flip = not self.direction_was_specified
+        # The flip about the center keeps the bounding box, so it and the move
+        # of the tip are a single transform of the points
+        box = self.get_box()
+        scale = np.ones(3)
         if want_to_flip and can_flip:
-            self.flip()
+            scale = np.array([-1., 1., -1.])
+            self.direction = -np.array(self.direction)
         if config.renderer == "opengl":
             boundary_point = mobject.get_bounding_box_point(UP - self.direction)
         else:
             boundary_point = mobject.get_critical_point(UP - self.direction)
         vector_from_center = 1.0 * (boundary_point - mob_center)
-        self.move_tip_to(mob_center + vector_from_center)
+        shift = mob_center + vector_from_center - self.get_tip_of_box(box)
+        self.apply_affine(scale, shift, (box[0] + box[1]) / 2)
+        if self.content is not None:
+            self.content.shift(shift)
         return self
 
     def position_mobject_inside(self, mobject):
@@ -88,17 +153,50 @@ class Bubble(SVGMobject, ABC):
         self.add_content(Tex(*text))
         return self
 
+    def get_content_size(self, content: Mobject) -> np.ndarray:
+        return np.array([
+            content.get_width() + max(MED_LARGE_BUFF, 2),
+            content.get_height() + 2.5 * LARGE_BUFF,
+        ])
+
+    def stretch_keeping_tip(self, scale: np.ndarray) -> SVGMobject:
+        # Stretching and keeping the tip in place as one transform
+        mins, maxs = self.get_box()
+        center = (mins + maxs) / 2
+        tip_point = self.get_tip_of_box((mins, maxs))
+        new_box = (center + scale * (mins - center), center + scale * (maxs - center))
+        return self.apply_affine(scale, tip_point - self.get_tip_of_box(new_box), center)
+
     def resize_to_content(self):
-        target_width = self.content.get_width()
-        target_width += max(MED_LARGE_BUFF, 2)
-        target_height = self.content.get_height()
-        target_height += 2.5 * LARGE_BUFF
-        tip_point = self.get_tip()
-        self.stretch_to_fit_width(target_width)
-        self.stretch_to_fit_height(target_height)
-        self.move_tip_to(tip_point)
+        mins, maxs = self.get_box()
+        scale = np.ones(3)
+        scale[:2] = self.get_content_size(self.content) / (maxs - mins)[:2]
+        self.stretch_keeping_tip(scale)
         self.position_mobject_inside(self.content)
 
+    def can_refit(self, bubble_class: type, bubble_kwargs: dict) -> bool:
+        """
+        Whether bubble_class(**bubble_kwargs) would differ from this bubble only in its
+        content, so that refit_to_content can stand in for building it. Only the direction
+        is compared, any other kwarg asks for a new bubble.
+        """
+        if type(self) is not bubble_class:
+            return False
+        for key, value in bubble_kwargs.items():
+            if key != "direction" or not np.allclose(self.direction, value):
+                return False
+        return True
+
+    def refit_to_content(self, content: Mobject) -> Mobject:
+        """
+        Puts a new content in place of the current one, stretching the outline by
+        the ratio of their sizes rather than fitting it from scratch.
+        """
+        scale = np.ones(3)
+        scale[:2] = self.get_content_size(content) / self.get_content_size(self.content)
+        self.stretch_keeping_tip(scale)
+        return self.add_content(content)
+
     def clear(self):
         self.add_content(VMobject())
         return self
@@ -116,6 +214,8 @@ class ThoughtBubble(Bubble, ABC):
         default_kwargs = {"file_name": str(Path(__file__).parent/"svgs/Bubbles_thought.svg")}
         default_kwargs.update(kwargs)
         super(ThoughtBubble, self).__init__(**default_kwargs)
+
+    def arrange_parts(self) -> None:
         self.submobjects.sort(
             key=lambda m: m.get_bottom()[1]
         )
@@ -125,7 +225,46 @@ class ThoughtBubble(Bubble, ABC):
         return self
 
 
-class VideoIcon(SVGMobject, ABC):
+class IconMeta(type(CompiledSVGMobject)):
+    """
+    Builds an icon once per class and arguments. Every later call returns a
+    copy-on-write clone of that icon, so all the instances share one geometry
+    and style until one of them is moved or restyled.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        key = (cls.__qualname__, config.renderer, config.frame_width, freeze(args), freeze(kwargs))
+        template = ICON_TEMPLATES.get(key)
+        if template is not None:
+            return copy_on_write(template)
+        icon = super(IconMeta, cls).__call__(*args, **kwargs)
+        ICON_TEMPLATES.put(key, copy_on_write(icon))
+        return icon
+
+
+class Icon(CompiledSVGMobject, ABC, metaclass=IconMeta):
+    pass
+
+
+def set_icons_color(icons: Iterable[Mobject], color: color.Color) -> Iterable[Mobject]:
+    """
+    Same as calling set_color on every icon, but all the recolored members
+    share one rgba buffer per opacity instead of holding an array each.
+    """
+    rgb = color_to_rgb(color)
+    groups = {}
+    for icon in icons:
+        for member in icon.family_members_with_points():
+            member.color = color
+            for array_name in ["fill_rgbas", "stroke_rgbas"]:
+                opacity = float(getattr(member, array_name)[0, 3])
+                groups.setdefault((array_name, opacity), []).append(member)
+    for (array_name, opacity), members in groups.items():
+        share_buffer(np.append(rgb, opacity).reshape(1, 4), members, array_name)
+    return icons
+
+
+class VideoIcon(Icon):
     def __init__(self, **kwargs):
         default_kwargs = {"file_name": str(Path(__file__).parent/"svgs/video_icon"), "width": config.frame_width / 16}
         default_kwargs.update(kwargs)
@@ -155,7 +294,7 @@ class VideoSeries(VGroup, ABC):
         self.set_color_by_gradient(*self.gradient_colors)
 
 
-class Tree(SVGMobject, ABC):
+class Tree(CompiledSVGMobject, ABC):
     def __init__(self, **kwargs):
         default_kwargs = {"file_name": str(Path(__file__).parent / "svgs/tree"), "width": config.frame_width / 16}
         default_kwargs.update(kwargs)
@@ -168,8 +307,104 @@ class Tree(SVGMobject, ABC):
         self[2].set_fill(color=BLUE, opacity=0.5)
 
 
+def _evaluate(function: Callable[[np.ndarray], np.ndarray], xs: np.ndarray) -> np.ndarray:
+    with np.errstate(all="ignore"):
+        return np.broadcast_to(np.asarray(function(xs), dtype=float), xs.shape)
+
+
+def sample_function(function: Callable[[np.ndarray], np.ndarray], x_range: Tuple[float, float],
+                    num_samples: int = 33, tolerance: float = 1e-3, max_depth: int = 8
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Samples a vectorized function over the range. Every pass halves the intervals whose
+    midpoint strays from the chord by more than tolerance (relative to the height of the
+    curve), evaluating the function once on all the new midpoints.
+    :param function: takes and returns an array of the same shape.
+    :param num_samples: uniform samples to start the refinement from.
+    :param max_depth: number of refinement passes, bounds the samples near poles.
+    """
+    key = (function, tuple(x_range), num_samples, tolerance, max_depth)
+    samples = FUNCTION_SAMPLES.get(key)
+    if samples is not None:
+        return samples
+
+    xs = np.linspace(x_range[0], x_range[1], num_samples)
+    ys = _evaluate(function, xs)
+    to_check = np.arange(num_samples - 1)
+    for _ in range(max_depth):
+        finite = ys[np.isfinite(ys)]
+        height = np.ptp(finite) if len(finite) else 0
+        mid_xs = (xs[to_check] + xs[to_check + 1]) / 2
+        mid_ys = _evaluate(function, mid_xs)
+        error = np.abs(mid_ys - (ys[to_check] + ys[to_check + 1]) / 2) / (height or 1)
+        # NaN errors count as too large, so the samples close in on the poles
+        too_coarse = ~(error <= tolerance)
+        split = to_check[too_coarse]
+        if not len(split):
+            break
+        xs = np.insert(xs, split + 1, mid_xs[too_coarse])
+        ys = np.insert(ys, split + 1, mid_ys[too_coarse])
+        # Both halves of a split interval are checked again on the next pass
+        inserted = split + 1 + np.arange(len(split))
+        to_check = np.union1d(inserted - 1, inserted)
+    xs.flags.writeable = False
+    ys.flags.writeable = False
+    return FUNCTION_SAMPLES.put(key, (xs, ys))
+
+
+class FunctionPlot(VMobject, ABC):
+    """
+    Smooth graph of a NumPy-vectorized function, sampled by sample_function. The samples
+    are mapped into the (linear) axes when they're given, otherwise x and y are scene
+    coordinates. Non-finite values break the graph into separate paths, and so do jumps
+    between neighbouring samples of more than max_jump of the y-range (the y-range of the
+    axes, or that of the samples), as across the asymptotes of tan.
+    """
+
+    def __init__(self, function: Callable[[np.ndarray], np.ndarray], x_range: Tuple[float, float] = (-1, 1),
+                 axes: Optional[Axes] = None, **kwargs):
+        self.function = function
+        self.x_range = x_range
+        self.axes = axes
+        self.num_samples = kwargs.pop("num_samples", 33)
+        self.tolerance = kwargs.pop("tolerance", 1e-3)
+        self.max_depth = kwargs.pop("max_depth", 8)
+        self.max_jump = kwargs.pop("max_jump", 0.5)
+        super(FunctionPlot, self).__init__(**kwargs)
+
+    def coords_to_points(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        if self.axes is None:
+            return np.column_stack([xs, ys, np.zeros_like(xs)])
+        # The axes are linear, so their origin and unit vectors give the whole mapping
+        origin = self.axes.c2p(0, 0)
+        x_unit = self.axes.c2p(1, 0) - origin
+        y_unit = self.axes.c2p(0, 1) - origin
+        return origin + xs[:, np.newaxis] * x_unit + ys[:, np.newaxis] * y_unit
+
+    def get_y_span(self, ys: np.ndarray) -> float:
+        if self.axes is not None:
+            return self.axes.y_range[1] - self.axes.y_range[0]
+        finite = ys[np.isfinite(ys)]
+        return np.ptp(finite) if len(finite) else 0
+
+    def generate_points(self):
+        xs, ys = sample_function(self.function, self.x_range, self.num_samples, self.tolerance, self.max_depth)
+        anchors = self.coords_to_points(xs, ys)
+        finite = np.isfinite(anchors).all(axis=1)
+        connected = finite[:-1] & finite[1:]
+        if self.max_jump is not None:
+            with np.errstate(invalid="ignore"):
+                connected &= ~(np.abs(np.diff(ys)) > self.max_jump * self.get_y_span(ys))
+        # Straight cubic segments between every pair of neighbouring connected samples
+        segments = np.flatnonzero(connected)
+        starts, ends = anchors[segments], anchors[segments + 1]
+        points = np.stack([starts, (2 * starts + ends) / 3, (starts + 2 * ends) / 3, ends], axis=1)
+        self.points = points.reshape(-1, 3)
+        if len(segments):
+            self.make_smooth()
+
+
 class Sigmoid(VGroup, ABC):
-    # TODO: Make more general
     def __init__(self, **kwargs):
         axes = Axes(
             x_range=[-10, 10, 1],
@@ -177,12 +412,11 @@ class Sigmoid(VGroup, ABC):
             x_length=10,
             axis_config={"color": BLUE}
         )
-        sigmoid_graph = axes.get_graph(lambda x: sigmoid(x), color=RED)
-        sigmoid_graph.set_stroke(width=2)
+        sigmoid_graph = FunctionPlot(sigmoid, x_range=(-10, 10), axes=axes, color=RED, stroke_width=2)
         super(Sigmoid, self).__init__(axes, sigmoid_graph)
 
 
-class Clusters(SVGMobject, ABC):
+class Clusters(CompiledSVGMobject, ABC):
     def __init__(self, **kwargs):
         default_kwargs = {"file_name": str(Path(__file__).parent / "svgs/clusters"),
                           "width": config.frame_width / 16}
@@ -196,42 +430,237 @@ class Clusters(SVGMobject, ABC):
         self[29:].set_color(BLUE)
 
 
-class NotebookWithNotes(SVGMobject, ABC):
+class ScatterClusters(VGroup, ABC):
+    """
+    Scatter plot of labelled points, e.g. k-means output. The dots of every label are
+    drawn as the subpaths of a single VMobject, so the number of submobjects is the
+    number of labels however many points there are.
+    """
+
+    def __init__(self, points: np.ndarray, labels: np.ndarray, **kwargs):
+        points = np.asarray(points, dtype=float)
+        self.positions = np.zeros((len(points), 3))
+        self.positions[:, :points.shape[1]] = points
+        self.labels = np.asarray(labels, dtype=int)
+        self.dot_radius = kwargs.pop("dot_radius", 0.03)
+        self.colors = kwargs.pop("colors", [BLUE, RED, GREEN, YELLOW, PURPLE, ORANGE, TEAL, PINK])
+        self.num_labels = kwargs.pop("num_labels", self.labels.max() + 1 if len(self.labels) else 1)
+        self.drawn_indices = [np.zeros(0, dtype=int) for _ in range(self.num_labels)]
+        clusters = [VMobject(fill_opacity=1, stroke_width=0) for _ in range(self.num_labels)]
+        for label, cluster in enumerate(clusters):
+            cluster.set_fill(self.get_label_color(label))
+        super(ScatterClusters, self).__init__(*clusters, **kwargs)
+        self.redraw()
+
+    def get_label_color(self, label: int) -> color.Color:
+        return self.colors[label % len(self.colors)]
+
+    def get_dot_points(self, indices: np.ndarray) -> np.ndarray:
+        circle = self.dot_radius * get_unit_circle_points()
+        return (self.positions[indices, np.newaxis, :] + circle).reshape(-1, 3)
+
+    def sync_positions(self) -> None:
+        """
+        Reads the positions and the radius back from the drawn dots, so that
+        moving or scaling the clusters like any mobject carries over to redraws.
+        """
+        num_points = len(get_unit_circle_points())
+        for label in range(self.num_labels):
+            dots = self[label].points.reshape(-1, num_points, 3)
+            if not len(dots):
+                continue
+            centers = dots.mean(axis=1)
+            self.positions[self.drawn_indices[label]] = centers
+            self.dot_radius = np.linalg.norm(dots[0, 0] - centers[0])
+
+    def redraw(self, mask: Optional[np.ndarray] = None):
+        """
+        Rebuilds the dots of every label, leaving out the points where mask is False.
+        """
+        self.sync_positions()
+        for label in range(self.num_labels):
+            selected = self.labels == label
+            if mask is not None:
+                selected &= mask
+            self.drawn_indices[label] = np.flatnonzero(selected)
+            self[label].points = self.get_dot_points(self.drawn_indices[label])
+        return self
+
+    def set_labels(self, labels: np.ndarray):
+        self.labels = np.asarray(labels, dtype=int)
+        return self.redraw()
+
+    def get_relabel_animation(self, labels: np.ndarray, **kwargs) -> Animation:
+        return RelabelClusters(self, labels, **kwargs)
+
+
+class RelabelClusters(Animation):
+    """
+    Recolors the points of ScatterClusters whose label changes. The moving dots are
+    grouped by their (old, new) label pair, one VMobject per pair blending the colors.
+    """
+
+    def __init__(self, clusters: ScatterClusters, labels: np.ndarray, **kwargs):
+        self.labels = np.asarray(labels, dtype=int)
+        self.transitions = []
+        super(RelabelClusters, self).__init__(clusters, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+    def begin(self) -> None:
+        clusters = self.mobject
+        clusters.sync_positions()
+        moved = clusters.labels != self.labels
+        pairs = np.column_stack([clusters.labels[moved], self.labels[moved]])
+        indices = np.flatnonzero(moved)
+        for old_label, new_label in np.unique(pairs, axis=0):
+            transition = VMobject(fill_opacity=1, stroke_width=0)
+            transition.points = clusters.get_dot_points(
+                indices[(pairs[:, 0] == old_label) & (pairs[:, 1] == new_label)]
+            )
+            self.transitions.append((transition, old_label, new_label))
+        clusters.redraw(~moved)
+        clusters.add(*[transition for transition, _, _ in self.transitions])
+        super(RelabelClusters, self).begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        clusters = self.mobject
+        alpha = self.rate_func(alpha)
+        for transition, old_label, new_label in self.transitions:
+            transition.set_fill(interpolate_color(
+                clusters.get_label_color(old_label), clusters.get_label_color(new_label), alpha
+            ))
+
+    def finish(self) -> None:
+        super(RelabelClusters, self).finish()
+        self.mobject.remove(*[transition for transition, _, _ in self.transitions])
+        self.transitions = []
+        self.mobject.set_labels(self.labels)
+
+
+class NotebookWithNotes(Icon):
     def __init__(self, **kwargs):
         default_kwargs = {"file_name": str(Path(__file__).parent / "svgs/notebook_with_jots"),
                           "width": config.frame_width / 16}
         default_kwargs.update(kwargs)
         super(NotebookWithNotes, self).__init__(**default_kwargs)
-        _color = kwargs.get("color", WHITE)
-        for mobject in self:
-            mobject.set_color(_color)
+        set_icons_color([self], kwargs.get("color", WHITE))
 
 
-class Lock(SVGMobject, ABC):
+class Lock(Icon):
     def __init__(self, **kwargs):
         default_kwargs = {"file_name": str(Path(__file__).parent / "svgs/lock"),
                           "width": config.frame_width / 16}
         default_kwargs.update(kwargs)
         super(Lock, self).__init__(**default_kwargs)
-        self[0].set_color(kwargs.get("color", WHITE))
+        set_icons_color([self[0]], kwargs.get("color", WHITE))
 
 
-class Cross(SVGMobject, ABC):
+class Cross(Icon):
     def __init__(self, **kwargs):
         default_kwargs = {"file_name": str(Path(__file__).parent / "svgs/cross"),
                           "width": config.frame_width / 16}
         default_kwargs.update(kwargs)
         super(Cross, self).__init__(**default_kwargs)
-        self[0].set_color(kwargs.get("color", RED))
+        set_icons_color([self[0]], kwargs.get("color", RED))
 
 
-class Check(SVGMobject, ABC):
+class Check(Icon):
     def __init__(self, **kwargs):
         default_kwargs = {"file_name": str(Path(__file__).parent / "svgs/check"),
                           "width": config.frame_width / 16}
         default_kwargs.update(kwargs)
         super(Check, self).__init__(**default_kwargs)
-        self[0].set_color(kwargs.get("color", GREEN))
+        set_icons_color([self[0]], kwargs.get("color", GREEN))
+
+
+class TypeText(Animation):
+    """
+    Types a text glyph by glyph, with a blinking caret after the last typed glyph.
+    Glyphs are shown and hidden by swapping prebuilt style arrays, and a frame only
+    touches the glyphs typed since the previous one, so the cost of a frame doesn't
+    grow with the length of the text.
+    """
+
+    RGBA_ATTRS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+    def __init__(self, text: Text, **kwargs):
+        """
+        :param rhythm: relative durations of the keystrokes, repeated over the glyphs.
+        :param speed_variation: random relative jitter of every keystroke, drawn from seed.
+        """
+        self.rhythm = kwargs.pop("rhythm", None)
+        self.speed_variation = kwargs.pop("speed_variation", 0)
+        self.seed = kwargs.pop("seed", 0)
+        self.show_caret = kwargs.pop("show_caret", True)
+        self.caret_blink_period = kwargs.pop("caret_blink_period", 0.5)
+        self.caret_color = kwargs.pop("caret_color", None)
+        time_per_char = kwargs.pop("time_per_char", 0.1)
+        kwargs.setdefault("rate_func", linear)
+        kwargs.setdefault("run_time", max(1, time_per_char * len(text.family_members_with_points())))
+        self.caret = None
+        super(TypeText, self).__init__(text, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+    def begin(self) -> None:
+        text = self.mobject
+        self.glyphs = text.family_members_with_points()
+        num_glyphs = len(self.glyphs)
+        durations = np.ones(num_glyphs) if self.rhythm is None else np.resize(np.asarray(self.rhythm, float), num_glyphs)
+        if self.speed_variation:
+            rng = np.random.default_rng(self.seed)
+            durations *= rng.uniform(1 - self.speed_variation, 1 + self.speed_variation, num_glyphs)
+        # A glyph appears when its keystroke ends, so the last one lands exactly at the end
+        self.typed_alphas = np.cumsum(durations) / durations.sum()
+        self.typed_alphas[-1:] = 1
+
+        self.styles = []
+        for glyph in self.glyphs:
+            shown = [getattr(glyph, attr) for attr in self.RGBA_ATTRS]
+            hidden = [np.array(rgbas) for rgbas in shown]
+            for rgbas in hidden:
+                rgbas[:, 3] = 0
+            self.styles.append((shown, hidden))
+        self.typed = num_glyphs
+        self.set_typed(0)
+
+        if self.show_caret and num_glyphs:
+            rights = np.array([glyph.get_right()[0] for glyph in self.glyphs])
+            self.caret_xs = np.append(self.glyphs[0].get_left()[0] - SMALL_BUFF / 2, rights + SMALL_BUFF / 2)
+            self.caret = Line(text.get_bottom(), text.get_top(), stroke_width=2)
+            self.caret.set_color(self.caret_color or text.get_color())
+            self.caret.set_x(self.caret_xs[0])
+            self.caret_visible = True
+            text.add(self.caret)
+        super(TypeText, self).begin()
+
+    def set_typed(self, typed: int) -> None:
+        start, stop = sorted((self.typed, typed))
+        for glyph, (shown, hidden) in zip(self.glyphs[start:stop], self.styles[start:stop]):
+            for attr, rgbas in zip(self.RGBA_ATTRS, shown if typed > self.typed else hidden):
+                setattr(glyph, attr, rgbas)
+        self.typed = typed
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        typed = int(np.searchsorted(self.typed_alphas, self.rate_func(alpha), side="right"))
+        if typed != self.typed:
+            self.set_typed(typed)
+            if self.caret is not None:
+                self.caret.set_x(self.caret_xs[typed])
+        if self.caret is not None:
+            visible = int(2 * alpha * self.run_time / self.caret_blink_period) % 2 == 0
+            if visible != self.caret_visible:
+                self.caret.set_stroke(opacity=float(visible))
+                self.caret_visible = visible
+
+    def finish(self) -> None:
+        super(TypeText, self).finish()
+        if self.caret is not None:
+            self.mobject.remove(self.caret)
+            self.caret = None
 
 
 class SearchBar(VGroup, ABC):
@@ -240,7 +669,7 @@ class SearchBar(VGroup, ABC):
                  icon_stroke_width: int = DEFAULT_STROKE_WIDTH, **st_kw):
 
         search_term = Text(search_term, **st_kw) if isinstance(search_term, str) else search_term
-        search_icon = SVGMobject(file_name=str(Path(__file__).parent / "svgs/search"))
+        search_icon = CompiledSVGMobject(file_name=str(Path(__file__).parent / "svgs/search"))
 
         sb_height = search_term.height
         sb_color = sb_color
@@ -273,7 +702,7 @@ class SearchBar(VGroup, ABC):
         return self[1]
 
     def type_search_term(self, **kwargs) -> Animation:
-        return AddTextLetterByLetter(self.search_term, **kwargs)
+        return TypeText(self.search_term, **kwargs)
 
     def appear_search_box(self) -> Animation:
         return FadeIn(self.search_box, self.search_icon)
@@ -0,0 +1,85 @@
+"""
+Import-to-first-frame benchmark of the scenes of a module.
+
+Every scene runs in a fresh interpreter, which imports the module, builds the scene,
+runs its setup and construct up to the first play or wait and renders that frame.
+Run from the project directory:
+
+    python -m custom.scene_benchmark main [SceneName ...]
+"""
+import argparse
+import importlib
+import inspect
+import json
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from manim import *
+
+
+class _FirstFrame(Exception):
+    pass
+
+
+def get_scene_names(module_name: str) -> List[str]:
+    module = importlib.import_module(module_name)
+    return [
+        name for name, cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(cls, Scene) and cls.__module__ == module.__name__
+    ]
+
+
+def time_first_frame(module_name: str, scene_name: str) -> Dict[str, float]:
+    """
+    Times of the import, the setup and the first rendered frame of a scene,
+    counted from the start of the import. Meant to run in its own process.
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    imported = time.perf_counter()
+
+    with tempconfig({"write_to_movie": False, "save_last_frame": False, "disable_caching": True}):
+        scene = getattr(module, scene_name)()
+
+        def render_first_frame(*args, **kwargs):
+            scene.renderer.update_frame(scene, ignore_skipping=True)
+            raise _FirstFrame
+
+        scene.play = scene.wait = render_first_frame
+        scene.setup()
+        set_up = time.perf_counter()
+        try:
+            scene.construct()
+        except _FirstFrame:
+            pass
+        first_frame = time.perf_counter()
+
+    return {"import": imported - start, "setup": set_up - start, "first_frame": first_frame - start}
+
+
+def benchmark_scenes(module_name: str, scene_names: List[str] = None) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for scene_name in scene_names or get_scene_names(module_name):
+        output = subprocess.run(
+            [sys.executable, "-m", __spec__.name, module_name, scene_name, "--child"],
+            capture_output=True, text=True, check=True
+        ).stdout
+        results[scene_name] = json.loads(output.splitlines()[-1])
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("module", help="module defining the scenes, e.g. main")
+    parser.add_argument("scenes", nargs="*", help="scenes to time, all the scenes of the module by default")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(time_first_frame(args.module, args.scenes[0])))
+    else:
+        print(f"{'scene':<32}{'import, s':>12}{'setup, s':>12}{'first frame, s':>16}")
+        for name, times in benchmark_scenes(args.module, args.scenes).items():
+            print(f"{name:<32}{times['import']:>12.3f}{times['setup']:>12.3f}{times['first_frame']:>16.3f}")
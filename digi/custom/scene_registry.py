@@ -0,0 +1,121 @@
+"""
+Lifecycle of the scenes rendered by one process.
+
+Scenes are rendered one after another. The registry holds only the scene being
+rendered and clears its mobject graph once the render is done, so a batch render
+keeps one scene in memory at a time. The template and content caches live at module
+level and are deliberately shared by all the scenes: later scenes start warm, and
+the caches' own bounds keep their memory in check.
+
+    python -m custom.scene_registry main [SceneName ...]
+"""
+from __future__ import annotations
+import gc
+import importlib
+import inspect
+import sys
+import time
+import weakref
+from typing import Dict, List, Optional
+
+from manim import *
+
+# Caches shared by the scenes, as (module, attribute). Only the loaded modules are reported
+SHARED_CACHES = {
+    "pi_creature_templates": ("custom.characters.pi_creature", "PI_CREATURE_TEMPLATES"),
+    "bubble_templates": ("custom.drawings", "BUBBLE_TEMPLATES"),
+    "icon_templates": ("custom.drawings", "ICON_TEMPLATES"),
+    "function_samples": ("custom.drawings", "FUNCTION_SAMPLES"),
+    "content": ("custom.content_cache", "CONTENT_CACHE"),
+}
+
+
+class SceneRegistry:
+    """
+    Scene classes known to the process and the scene being rendered.
+    """
+
+    def __init__(self) -> None:
+        self.scene_classes = {}  # type: Dict[str, type]
+        self.render_times = {}  # type: Dict[str, float]
+        self._current = None
+        self._started = 0
+
+    def register(self, scene_class: type) -> type:
+        """
+        Adds a scene class, usable as a class decorator.
+        """
+        self.scene_classes[scene_class.__name__] = scene_class
+        return scene_class
+
+    def register_module(self, module_name: str) -> List[type]:
+        """
+        Adds every scene class defined in the module.
+        """
+        module = importlib.import_module(module_name)
+        scene_classes = [
+            cls for _, cls in inspect.getmembers(module, inspect.isclass)
+            if issubclass(cls, Scene) and cls.__module__ == module.__name__
+        ]
+        for scene_class in scene_classes:
+            self.register(scene_class)
+        return scene_classes
+
+    @property
+    def current(self) -> Optional[Scene]:
+        return self._current() if self._current is not None else None
+
+    def begin(self, scene: Scene) -> None:
+        if self.current is scene:
+            return
+        if self.current is not None:
+            raise RuntimeError(f"{type(self.current).__name__} is still being rendered")
+        self._current = weakref.ref(scene)
+        self._started = time.perf_counter()
+
+    def end(self, scene: Scene) -> None:
+        """
+        Releases the mobjects of a rendered scene, the shared caches are kept.
+        """
+        if self.current is not scene:
+            return
+        self.render_times[type(scene).__name__] = time.perf_counter() - self._started
+        self._current = None
+        scene.clear()
+        gc.collect()
+
+    def render(self, *scene_names: str) -> None:
+        """
+        Renders the scenes one after another, all the registered ones by default.
+        """
+        for scene_name in scene_names or list(self.scene_classes):
+            scene = self.scene_classes[scene_name]()
+            self.begin(scene)
+            try:
+                scene.render()
+            finally:
+                self.end(scene)
+            del scene
+
+    def get_cache_stats(self) -> Dict[str, dict]:
+        return {
+            name: getattr(sys.modules[module_name], attr).stats()
+            for name, (module_name, attr) in SHARED_CACHES.items()
+            if module_name in sys.modules
+        }
+
+
+SCENE_REGISTRY = SceneRegistry()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        raise SystemExit("Expected a module, e.g. python -m custom.scene_registry main [SceneName ...]")
+    # The registry the scenes report to, not the copy of this module running as __main__
+    registry = importlib.import_module(__spec__.name).SCENE_REGISTRY
+    registry.register_module(sys.argv[1])
+    registry.render(*sys.argv[2:])
+    for name, seconds in registry.render_times.items():
+        print(f"{name:<32}{seconds:>10.2f} s")
+    for name, stats in registry.get_cache_stats().items():
+        print(f"{name:<32}{stats}")
@@ -0,0 +1,175 @@
+"""
+Copy-on-write array buffers for mobject copies.
+
+copy_on_write(mobject) returns a copy whose family shares the point and style arrays
+of the original. The shared buffers are read-only; the first item assignment or
+in-place operation through a mobject attribute gives that mobject a private copy,
+while plain assignments (which most of manim does) just replace the shared buffer.
+"""
+from __future__ import annotations
+import copy
+from typing import Any, Iterable
+
+import numpy as np
+from manim import *
+
+COPY_ON_WRITE_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+def _private_name(attr: str) -> str:
+    return f"_shared_{attr}"
+
+
+class SharedArray(np.ndarray):
+    """
+    Read-only view of a buffer shared between a mobject and its copies.
+    """
+
+    def __array_finalize__(self, obj: Any) -> None:
+        self.owner = None
+        self.attr = None
+        self.private = None
+        # Slices remember what they were taken from, so that writes through them reach the owner
+        self.parent = None
+        self.key = None
+
+    def __array_wrap__(self, array: np.ndarray, *args, **kwargs) -> Any:
+        # Results of ufuncs are plain arrays owned by nobody
+        array = array.view(np.ndarray)
+        return array[()] if array.ndim == 0 else array
+
+    def __deepcopy__(self, memo: dict) -> np.ndarray:
+        return np.array(self.view(np.ndarray))
+
+    def _materialize(self) -> np.ndarray:
+        if self.private is None:
+            self.private = np.array(self.view(np.ndarray))
+            self.owner.__dict__[_private_name(self.attr)] = self.private
+        return self.private
+
+    def _writable(self) -> np.ndarray:
+        """
+        The writable array standing for this one, the owner's private copy or the same slice of it.
+        """
+        if self.owner is not None:
+            return self._materialize()
+        if self.parent is not None:
+            return self.parent._writable()[self.key]
+        return self.view(np.ndarray)
+
+    def __getitem__(self, key: Any) -> Any:
+        item = super(SharedArray, self).__getitem__(key)
+        if isinstance(item, SharedArray):
+            item.parent = self
+            item.key = key
+        return item
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._writable()[key] = value
+
+
+def _in_place(name: str):
+    def method(self: SharedArray, other: Any) -> np.ndarray:
+        writable = self._writable()
+        getattr(writable, name)(other)
+        return writable
+    method.__name__ = name
+    return method
+
+
+for _name in ["__iadd__", "__isub__", "__imul__", "__itruediv__", "__ipow__"]:
+    setattr(SharedArray, _name, _in_place(_name))
+
+
+def _shared_property(attr: str) -> property:
+    private = _private_name(attr)
+
+    def fget(self: Mobject) -> np.ndarray:
+        return self.__dict__[private]
+
+    def fset(self: Mobject, value: Any) -> None:
+        if isinstance(value, SharedArray):
+            if value.owner is not self:
+                # Views of a shared buffer, e.g. the [::-1] of reverse_direction, are read-only
+                # as well, so they are shared anew and the first write copies them
+                value = _share_view(value.view(np.ndarray), self, attr)
+        elif isinstance(value, np.ndarray) and not value.flags.writeable:
+            value = _share_view(value, self, attr)
+        self.__dict__[private] = value
+
+    return property(fget, fset)
+
+
+class CopyOnWriteMixin:
+    """
+    Routes the array attributes of a mobject through copy-on-write properties.
+    """
+
+
+for _attr in COPY_ON_WRITE_ATTRS:
+    setattr(CopyOnWriteMixin, _attr, _shared_property(_attr))
+
+_COPY_ON_WRITE_CLASSES = {}
+
+
+def _share_view(buffer: np.ndarray, owner: Mobject, attr: str) -> SharedArray:
+    buffer.flags.writeable = False
+    view = buffer.view(SharedArray)
+    view.owner = owner
+    view.attr = attr
+    return view
+
+
+def make_copy_on_write(mobject: Mobject) -> Mobject:
+    """
+    Swaps the class of the mobject for its copy-on-write subclass, which keeps the name.
+    """
+    cls = type(mobject)
+    if issubclass(cls, CopyOnWriteMixin):
+        return mobject
+    if cls not in _COPY_ON_WRITE_CLASSES:
+        _COPY_ON_WRITE_CLASSES[cls] = type(cls.__name__, (CopyOnWriteMixin, cls), {"__qualname__": cls.__qualname__})
+    for attr in COPY_ON_WRITE_ATTRS:
+        if attr in mobject.__dict__:
+            mobject.__dict__[_private_name(attr)] = mobject.__dict__.pop(attr)
+    mobject.__class__ = _COPY_ON_WRITE_CLASSES[cls]
+    return mobject
+
+
+def share_buffer(buffer: np.ndarray, mobjects: Iterable[Mobject], attr: str) -> np.ndarray:
+    """
+    Points the attribute of every mobject at one read-only buffer. The first
+    mobject writing into it gets a private copy, as with copy_on_write.
+    """
+    buffer = np.array(buffer)
+    for mobject in mobjects:
+        make_copy_on_write(mobject)
+        mobject.__dict__[_private_name(attr)] = _share_view(buffer, mobject, attr)
+    return buffer
+
+
+def copy_on_write(mobject: Mobject) -> Mobject:
+    """
+    Copy of the mobject whose family members share their point and style
+    buffers with the original until one of the sides writes into them.
+    The root mobject itself is deep copied, as Mobject.copy does, with its
+    family members mapped onto the shallow copies.
+    """
+    members = mobject.get_family()[1:]
+    clones = {}
+    for member in members:
+        make_copy_on_write(member)
+        clones[id(member)] = copy.copy(member)
+    for member in members:
+        clone = clones[id(member)]
+        for attr in COPY_ON_WRITE_ATTRS:
+            private = _private_name(attr)
+            buffer = member.__dict__.get(private)
+            if not isinstance(buffer, np.ndarray):
+                continue
+            buffer = buffer.view(np.ndarray) if isinstance(buffer, SharedArray) else buffer
+            member.__dict__[private] = _share_view(buffer, member, attr)
+            clone.__dict__[private] = _share_view(buffer, clone, attr)
+        clone.submobjects = [clones[id(submobject)] for submobject in member.submobjects]
+        clone.updaters = list(member.updaters)
+    return copy.deepcopy(mobject, dict(clones))
@@ -1,31 +1,141 @@
+import json
+import threading
 import typing
+import zlib
+from collections import OrderedDict
 
 from manim import *
 
-__all__ = ["Singleton", "is_singleton_initialized", "parent_kwargs"]
+__all__ = ["parent_kwargs", "TemplateCache", "get_unit_circle_points", "get_mobject_nbytes", "freeze", "SceneRandom"]
 
+_UNIT_CIRCLE_POINTS = None
 
-class Singleton(type):
+
+def freeze(value: typing.Any) -> typing.Hashable:
+    """
+    Hashable stand-in for keyword arguments, used to key the template caches.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return str(value)
+
+
+class TemplateCache:
     """
-    Meta-class from https://stackoverflow.com/questions/6760685/creating-a-singleton-in-python#6798042.
+    Size-bounded least-recently-used cache of prebuilt mobjects.
+    The stored templates are never handed out directly, callers are
+    expected to clone them. Safe to fill from several threads.
     """
-    instances = {}
 
-    def __call__(cls, *args, **kwargs):
+    def __init__(self, max_size: int = 64, max_bytes: typing.Optional[int] = None) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._templates = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._templates
+
+    def get(self, key: typing.Hashable) -> typing.Optional[Mobject]:
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._templates.move_to_end(key)
+            return template
+
+    def put(self, key: typing.Hashable, template: Mobject) -> Mobject:
+        size = get_mobject_nbytes(template) if self.max_bytes is not None and isinstance(template, Mobject) else 0
+        with self._lock:
+            self.nbytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_size or \
+                    (self.max_bytes is not None and self.nbytes > self.max_bytes and len(self._templates) > 1):
+                evicted_key, _ = self._templates.popitem(last=False)
+                self.nbytes -= self._sizes.pop(evicted_key)
+        return template
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        return {"size": len(self), "max_size": self.max_size, "nbytes": self.nbytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses}
+
+
+def get_mobject_nbytes(mobject: Mobject) -> int:
+    """
+    Memory held by the point and color arrays of the mobject family.
+    """
+    return sum(
+        value.nbytes
+        for member in mobject.get_family()
+        for value in vars(member).values()
+        if isinstance(value, np.ndarray)
+    )
+
+
+class SceneRandom:
+    """
+    Seeded randomness of a scene, so that re-renders draw the same numbers and hit
+    manim's partial movie cache. Every purpose draws from its own named stream,
+    so extra draws for one of them don't shift the numbers of the others.
+    """
+
+    def __init__(self, scene_name: str, seed: typing.Optional[int] = None) -> None:
         """
-        This class is a Singleton. Exact docstring and init
-        signature should be found at the class definition.
+        :param scene_name: the seed is derived from it unless given explicitly
         """
-        if cls not in cls.instances:
-            cls.instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls.instances[cls]
+        self.seed = zlib.crc32(scene_name.encode()) if seed is None else seed
+        self.streams = {}
+
+    def get_stream(self, name: str = "default") -> np.random.Generator:
+        if name not in self.streams:
+            self.streams[name] = np.random.default_rng([self.seed, zlib.crc32(name.encode())])
+        return self.streams[name]
+
+    def choice(self, items: typing.Sequence, stream: str = "default") -> typing.Any:
+        return items[int(self.get_stream(stream).integers(len(items)))]
+
+    def shuffle(self, items: list, stream: str = "default") -> list:
+        self.get_stream(stream).shuffle(items)
+        return items
+
+    def random(self, size: typing.Optional[int] = None, stream: str = "default") -> typing.Union[float, np.ndarray]:
+        return self.get_stream(stream).random(size)
+
+    def save(self, file_name: str) -> None:
+        with open(file_name, "w") as file:
+            json.dump({"seed": self.seed, "streams": sorted(self.streams)}, file)
 
 
-def is_singleton_initialized(cls):
+def get_unit_circle_points() -> np.ndarray:
     """
-    Checks if singleton class was already initialized.
+    Points of the unit circle centered at the origin, shared by every generated circle.
     """
-    return cls in Singleton.instances
+    global _UNIT_CIRCLE_POINTS
+    if _UNIT_CIRCLE_POINTS is None:
+        _UNIT_CIRCLE_POINTS = Circle(radius=1).get_points()
+        _UNIT_CIRCLE_POINTS.flags.writeable = False
+    return _UNIT_CIRCLE_POINTS
 
 
 def _get_bubble_kwargs(**kwargs) -> dict:
@@ -2,19 +2,18 @@ import numpy as np
 from typing import Optional, Sequence
 from manim import *
 from typing import Tuple, List, Union
+from custom.animations import apply_points_function
 from custom.characters.pi_creature import PiCreature
-from custom.characters.pi_creature_scene import PiCreatureScene, CustomersScene
-from custom.drawings import (
-    VideoSeries, Tree, Sigmoid, Clusters, NotebookWithNotes, Lock, Cross, Check, SearchBar
-)
 from custom.characters.pi_creature_animations import Blink, PiCreatureSays
+from custom.characters.pi_creature_scene import PiCreatureScene, CustomersScene
+from custom.content_cache import cached_text
+from custom.drawings import VideoSeries, Tree, Sigmoid, Clusters, NotebookWithNotes, Lock, Cross, Check, SearchBar
 
 
 class Introduction(PiCreatureScene):
     series = None
 
     def construct(self):
-        PiCreatureScene().setup()
         self.thumbnail()
         self.videos_thumbnail()
 
@@ -122,7 +121,7 @@ class QueryResponseScene(PiCreatureScene):
         ]).arrange(RIGHT).to_edge(UP)
 
         self.start_products = [
-            Text(product) for product in [
+            cached_text(product) for product in [
                 "Смартфон APPLE iPhone 12 чёрный",
                 "Смартфон APPLE iPhone 11 чёрный",
                 "Смартфон APPLE iPhone 13 белый",
@@ -227,7 +226,7 @@ class QueryResponseScene(PiCreatureScene):
         """At the last OR state we add new ('glaze') products down to the OR response and
         dyeing the 'glaze' purple."""
         glaze_products = [
-            Text(product) for product in [
+            cached_text(product) for product in [
                 'Конфеты глазированные "Отломи"',
                 'Сырок глазированный с ванилью'
             ]
@@ -275,7 +274,6 @@ class QueryResponseScene(PiCreatureScene):
 class QueryMeaning(QueryResponseScene):
 
     def construct(self):
-        QueryResponseScene().setup()
         self._pi_creature_think_about_query()
         self.query_responses()
         self.query_probas()
@@ -506,7 +504,8 @@ class QueryMeaning(QueryResponseScene):
 
 
 class VipryamitelMeaning(Scene):
-    pi_customer = PiCreature(mode="angry")
+    def setup(self) -> None:
+        self.pi_customer = PiCreature(mode="angry")
 
     def construct(self):
         self.typo_query_probas_scene()
@@ -596,7 +595,7 @@ class VipryamitelBlackBoxScene(CustomersScene):
 
         # Generally, the same query
         self.correct_queries = [
-            Text(correction).set_color(GREEN) for correction in ["iphone белый"] * 4
+            cached_text(correction).set_color(GREEN) for correction in ["iphone белый"] * 4
         ]
         super(VipryamitelBlackBoxScene, self).__init__()
 
@@ -676,10 +675,7 @@ class VipryamitelBlackBoxScene(CustomersScene):
         """
         vect = -self.black_box.get_center() + [0, -1, 0]
 
-        self.play(*[
-            ApplyPointwiseFunction(lambda point: (point + vect) * radius, mob)
-            for mob in self.mobjects
-        ])
+        self.play(*apply_points_function(lambda points: (points + vect) * radius, *self.mobjects))
 
 
 class FunnelTemplate:
@@ -901,7 +897,7 @@ class VipryamitelFunnel(Scene):
         self.play(*list(map(lambda instance: Wiggle(instance), kostyl)))
 
         # Transform the lines into the 'Kostyl' label
-        kostyl_label = Text("Kostyl", color=YELLOW).to_edge(UP / 2)
+        kostyl_label = cached_text("Kostyl", color=YELLOW).to_edge(UP / 2)
         self.play(ReplacementTransform(kostyl, kostyl_label))
         self.play(FadeOut(*[obj for obj in self.mobjects if obj != kostyl_label]))
         self.wait()
@@ -911,7 +907,7 @@ class KostylScene(MovingCameraScene):
     def __init__(self):
         super(KostylScene, self).__init__()
         # The kostyl_label is taken from VipryamitelFunnel due to video coherence
-        self.kostyl_label = Text("Kostyl", color=YELLOW).to_edge(UP / 2)
+        self.kostyl_label = cached_text("Kostyl", color=YELLOW).to_edge(UP / 2)
         # The funnel itself
         self.funnel = FunnelTemplate(buff=MED_SMALL_BUFF)
 
@@ -969,12 +965,12 @@ class KostylScene(MovingCameraScene):
 
         # Creating table
         table = MobjectTable(
-            [[words[0].copy(), Cross(), Check(), Text("ESSENTIAL PARFUMS PARIS"), Lock()],
-             [words[:2].copy(), Cross(), Cross(), Text("ESSENTIAL PARFUMS PARIS"), Lock()],
-             [base_query.copy(), Cross(), Cross(), Text("ESSENTIAL PARFUMS PARIS"), Lock()],
-             [words[1].copy(), Check(), Cross(), Text("ESSENTIAL PARFUMS PARIS"), Lock()],
-             [words[1:].copy(), Cross(), Cross(), Text("ESSENTIAL PARFUMS PARIS"), Lock()],
-             [words[2].copy(), Cross(), Cross(), Text("ESSENTIAL PARFUMS PARIS"), Lock()]],
+            [[words[0].copy(), Cross(), Check(), cached_text("ESSENTIAL PARFUMS PARIS"), Lock()],
+             [words[:2].copy(), Cross(), Cross(), cached_text("ESSENTIAL PARFUMS PARIS"), Lock()],
+             [base_query.copy(), Cross(), Cross(), cached_text("ESSENTIAL PARFUMS PARIS"), Lock()],
+             [words[1].copy(), Check(), Cross(), cached_text("ESSENTIAL PARFUMS PARIS"), Lock()],
+             [words[1:].copy(), Cross(), Cross(), cached_text("ESSENTIAL PARFUMS PARIS"), Lock()],
+             [words[2].copy(), Cross(), Cross(), cached_text("ESSENTIAL PARFUMS PARIS"), Lock()]],
             row_labels=[],
             col_labels=[NotebookWithNotes(color=GREEN), NotebookWithNotes(color=RED), Text("Трансформация"), Lock()],
             include_outer_lines=True
@@ -1239,7 +1235,7 @@ class KostylScene(MovingCameraScene):
 
         # The kostyl equation itself (whitelist + blacklist + feed)
         kostyl_equation = VGroup(
-            Text("Kostyl", color=YELLOW),
+            cached_text("Kostyl", color=YELLOW),
             MathTex("="),
             NotebookWithNotes(color=GREEN),
             MathTex("+"),
@@ -1321,7 +1317,7 @@ def kostyl_scan(self: Scene, obj: Mobject):
     # Vertical kostyl line
     kostyl_line = Line(start=obj.get_top(), end=obj.get_bottom(), color=YELLOW).next_to(obj, LEFT, buff=0)
     # Kostyl label over line
-    kostyl_label = Text("Kostyl", color=YELLOW).scale(0.5).next_to(kostyl_line, UP)
+    kostyl_label = cached_text("Kostyl", color=YELLOW).scale(0.5).next_to(kostyl_line, UP)
     # Make label able to follow the line (scanner)
     kostyl_label.add_updater(lambda label: label.next_to(kostyl_line, UP))
     # Create the path which one the scanner will pass
@@ -1615,7 +1611,6 @@ class ReplaceBrands(PiCreatureScene, ThreeDScene):
         )
 
         self.questions = VGroup()
-        self.setup()
 
     def construct(self):
         self.pi_creature.scale(0.5).to_corner(RIGHT).flip()
@@ -1733,7 +1728,7 @@ class ReplaceBrands(PiCreatureScene, ThreeDScene):
         self.play(self.pi_creature.animate.change_mode("raise_right_hand"))
         for idx, brand_list in enumerate(vertical_brand_lists[1:]):
             # place at the random place surrounding the first brand list
-            pos = vertical_brand_lists[0].get_center() + np.random.random(3)
+            pos = vertical_brand_lists[0].get_center() + self.scene_random.random(3, "brand_positions")
             if idx == 0:
                 # For the first list it just appears over Pi creature
                 self.play(FadeIn(brand_list))
@@ -1742,7 +1737,9 @@ class ReplaceBrands(PiCreatureScene, ThreeDScene):
                 # Due to one of the lists is already at its position we start from the second one, but
                 # its index is 0)))
                 self.play(vertical_brand_lists[idx].animate.move_to(pos), FadeIn(brand_list))
-        self.play(vertical_brand_lists[-1].animate.move_to(vertical_brand_lists[0].get_center() + np.random.random(3)))
+        self.play(vertical_brand_lists[-1].animate.move_to(
+            vertical_brand_lists[0].get_center() + self.scene_random.random(3, "brand_positions")
+        ))
 
         # Transform the sites brand lists to the huge vertical brand list
         self.play(ReplacementTransform(vertical_brand_lists, self.vertical_brands_list))
@@ -1774,32 +1771,32 @@ class ReplaceBrands(PiCreatureScene, ThreeDScene):
                 [
                     words[0].copy().scale(1.8),
                     Cross(),
-                    Text("colombo new", height=words[0].height).scale(1.8)
+                    cached_text("colombo new", height=words[0].height).scale(1.8)
                 ],
                 [
                     words[:2].copy().scale(1.8),
                     Cross(),
-                    Text("colombo new", height=words[0].height).scale(1.8)
+                    cached_text("colombo new", height=words[0].height).scale(1.8)
                 ],
                 [
                     self.colombo_new_query.copy().scale(1.8),
                     Cross(),
-                    Text("colombo new", height=words[0].height).scale(1.8)
+                    cached_text("colombo new", height=words[0].height).scale(1.8)
                 ],
                 [
                     words[1].copy().scale(1.8),
                     Cross(),
-                    Text("colombo new", height=words[0].height).scale(1.8)
+                    cached_text("colombo new", height=words[0].height).scale(1.8)
                 ],
                 [
                     words[1:].copy().scale(1.8),
                     Check(),
-                    Text("colombo new", height=words[0].height).scale(1.8)
+                    cached_text("colombo new", height=words[0].height).scale(1.8)
                 ],
                 [
                     words[2].copy().scale(1.8),
                     Cross(),
-                    Text("colombo new", height=words[0].height).scale(1.8)
+                    cached_text("colombo new", height=words[0].height).scale(1.8)
                 ],
             ],
             row_labels=[],
@@ -2268,7 +2265,7 @@ class ReplaceBrands(PiCreatureScene, ThreeDScene):
         )
         self.wait()
 
-        to_much = Text("Всё равно достаточно много", color=RED).scale(0.5).next_to(self.pi_creature.bubble, UP)
+        to_much = cached_text("Всё равно достаточно много", color=RED).scale(0.5).next_to(self.pi_creature.bubble, UP)
         arrow = Arrow(to_much, braces_and_height[2][0].get_center(), color=RED)
         self.play(FadeIn(to_much, arrow))
         self.wait(2)
@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The scenes import custom as a top level package, run from the project directory
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("manim")
+
+
+@pytest.fixture
+def dry_run():
+    from manim import tempconfig
+
+    with tempconfig({"dry_run": True, "disable_caching": True, "frame_rate": 5}):
+        yield
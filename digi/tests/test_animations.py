@@ -0,0 +1,29 @@
+import numpy as np
+from manim import *
+
+from custom.animations import ApplyPointsFunction, apply_points_function
+
+
+def test_apply_points_function():
+    square = Square()
+    animation = ApplyPointsFunction(lambda points: 2 * points, square)
+    animation.begin()
+    animation.finish()
+    assert np.isclose(square.width, 4)
+
+
+def test_apply_points_function_calls_the_function_once():
+    calls = []
+
+    def function(points):
+        calls.append(len(points))
+        return points + RIGHT
+
+    mobjects = [Square(), Circle(), VGroup(Square(), Square())]
+    animations = apply_points_function(function, *mobjects)
+    assert len(calls) == 1
+    assert [animation.mobject for animation in animations] == mobjects
+    for animation in animations:
+        animation.begin()
+        animation.finish()
+    assert np.allclose(mobjects[0].get_center(), RIGHT)
@@ -0,0 +1,51 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+from custom.assets import CompiledSVGMobject, get_compiled_dir
+
+SVG = Path(__file__).parent.parent / "custom" / "svgs" / "lock.svg"
+
+
+def copy_svg(tmp_path):
+    svg_file = tmp_path / SVG.name
+    shutil.copy(SVG, svg_file)
+    return svg_file
+
+
+def test_compiled_form_matches_the_parse(tmp_path):
+    svg_file = copy_svg(tmp_path)
+    parsed = SVGMobject(str(svg_file))
+    compiled = CompiledSVGMobject(str(svg_file))
+    assert (get_compiled_dir(compiled) / "meta.npz").exists()
+    loaded = CompiledSVGMobject(str(svg_file))
+    for mobject in [compiled, loaded]:
+        assert np.allclose(mobject.get_all_points(), parsed.get_all_points())
+
+
+def test_file_name_without_suffix(tmp_path):
+    svg_file = copy_svg(tmp_path)
+    mobject = CompiledSVGMobject(str(svg_file.with_suffix("")))
+    assert len(mobject.get_all_points()) > 0
+    assert (get_compiled_dir(mobject) / "meta.npz").exists()
+
+
+def test_broken_compiled_form_falls_back_to_the_svg(tmp_path):
+    svg_file = copy_svg(tmp_path)
+    compiled_dir = get_compiled_dir(CompiledSVGMobject(str(svg_file)))
+    (compiled_dir / "points.npy").write_bytes(b"broken")
+    mobject = CompiledSVGMobject(str(svg_file))
+    assert np.allclose(mobject.get_all_points(), SVGMobject(str(svg_file)).get_all_points())
+
+
+def test_each_style_gets_its_own_compiled_form(tmp_path):
+    svg_file = copy_svg(tmp_path)
+    styles = [{}, {"fill_opacity": 0.3, "color": RED}]
+    for style in styles + styles:
+        parsed = SVGMobject(str(svg_file), **style)
+        compiled = CompiledSVGMobject(str(svg_file), **style)
+        for member, parsed_member in zip(compiled.family_members_with_points(), parsed.family_members_with_points()):
+            assert np.allclose(member.get_fill_rgbas(), parsed_member.get_fill_rgbas())
+            assert np.allclose(member.get_stroke_rgbas(), parsed_member.get_stroke_rgbas())
@@ -0,0 +1,28 @@
+import numpy as np
+from manim import *
+
+from custom.characters.bubble_layout import BubbleLayout
+from custom.characters.pi_creature import PiCreature
+from custom.drawings import SpeechBubble
+
+
+def get_overlap(first, second):
+    lows = np.maximum(first[0], second[0])
+    highs = np.minimum(first[1], second[1])
+    return np.prod(np.clip(highs - lows, 0, None))
+
+
+def test_bubbles_do_not_overlap():
+    speakers = [PiCreature().scale(0.5).shift(LEFT), PiCreature().scale(0.5).shift(RIGHT)]
+    bubbles = [(pi, pi.get_bubble("hello there", bubble_class=SpeechBubble)) for pi in speakers]
+    BubbleLayout().place(bubbles)
+    first, second = [BubbleLayout.get_box(bubble) for _, bubble in bubbles]
+    assert get_overlap(first, second) == 0
+
+
+def test_placements_are_memoized():
+    layout = BubbleLayout()
+    for _ in range(2):
+        pi = PiCreature().scale(0.5)
+        layout.place([(pi, pi.get_bubble("hi", bubble_class=SpeechBubble))])
+    assert layout.placements.stats()["hits"] == 1
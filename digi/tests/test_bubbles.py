@@ -0,0 +1,28 @@
+from manim import *
+
+from custom.drawings import SpeechBubble, ThoughtBubble
+
+
+def test_bubble_template_clone_matches_a_parse():
+    first = SpeechBubble(direction=RIGHT)
+    second = SpeechBubble(direction=RIGHT)
+    assert np.allclose(first.get_all_points(), second.get_all_points())
+    assert np.allclose(second.direction, first.direction)
+
+
+def test_can_refit():
+    bubble = SpeechBubble(direction=LEFT)
+    assert bubble.can_refit(SpeechBubble, {})
+    assert bubble.can_refit(SpeechBubble, {"direction": LEFT})
+    assert not bubble.can_refit(SpeechBubble, {"direction": RIGHT})
+    assert not bubble.can_refit(SpeechBubble, {"direction": LEFT, "height": 2})
+    assert not bubble.can_refit(ThoughtBubble, {})
+
+
+def test_refit_to_content():
+    bubble = SpeechBubble()
+    bubble.add_content(Text("a"))
+    bubble.resize_to_content()
+    content = Text("a longer content")
+    bubble.refit_to_content(content)
+    assert bubble.content is content
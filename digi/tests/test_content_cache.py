@@ -0,0 +1,15 @@
+import numpy as np
+from manim import *
+
+from custom.content_cache import cached_text, CONTENT_CACHE
+
+
+def test_cached_text_is_a_private_copy():
+    first = cached_text("cached", color=RED)
+    hits = CONTENT_CACHE.stats()["hits"]
+    second = cached_text("cached", color=RED)
+    assert CONTENT_CACHE.stats()["hits"] == hits + 1
+    assert first is not second
+    points = np.array(first.get_all_points())
+    second.shift(UP)
+    assert np.allclose(first.get_all_points(), points)
@@ -0,0 +1,30 @@
+import numpy as np
+from manim import *
+
+from custom.drawings import FunctionPlot, sample_function, FUNCTION_SAMPLES
+
+
+def test_samples_are_cached():
+    first = sample_function(np.sin, (0, 1))
+    hits = FUNCTION_SAMPLES.stats()["hits"]
+    second = sample_function(np.sin, (0, 1))
+    assert FUNCTION_SAMPLES.stats()["hits"] == hits + 1
+    assert first is second
+
+
+def test_tan_is_split_at_its_asymptote():
+    plot = FunctionPlot(np.tan, x_range=(0, 3))
+    subpaths = plot.get_subpaths()
+    assert len(subpaths) >= 2
+    # No path crosses x = pi / 2
+    assert all(np.all(path[:, 0] <= np.pi / 2) or np.all(path[:, 0] >= np.pi / 2) for path in subpaths)
+
+
+def test_continuous_function_is_one_path():
+    plot = FunctionPlot(np.sin, x_range=(-3, 3))
+    assert len(plot.get_subpaths()) == 1
+
+
+def test_non_finite_values_split_the_graph():
+    plot = FunctionPlot(lambda xs: np.where(np.abs(xs) < 0.25, np.nan, xs), x_range=(-1, 1))
+    assert len(plot.get_subpaths()) == 2
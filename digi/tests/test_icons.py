@@ -0,0 +1,25 @@
+import numpy as np
+from manim import *
+
+from custom.drawings import Lock, Cross, Check, ICON_TEMPLATES, set_icons_color
+
+
+def test_icons_are_cloned_from_a_template():
+    first = Lock()
+    hits = ICON_TEMPLATES.stats()["hits"]
+    second = Lock()
+    assert ICON_TEMPLATES.stats()["hits"] == hits + 1
+    assert np.shares_memory(first[0].points, second[0].points)
+
+
+def test_moving_a_clone_leaves_the_others():
+    first, second = Cross(), Cross()
+    center = first.get_center()
+    second.shift(RIGHT)
+    assert np.allclose(first.get_center(), center)
+
+
+def test_set_icons_color():
+    icons = [Check(), Check()]
+    set_icons_color(icons, BLUE)
+    assert all(np.allclose(icon[0].fill_rgbas[0, :3], color_to_rgb(BLUE)) for icon in icons)
@@ -0,0 +1,36 @@
+import numpy as np
+from manim import *
+
+from custom.characters.pi_creature import PiCreature, PI_CREATURE_TEMPLATES
+
+
+def test_template_clone_has_root_style():
+    PiCreature(color=BLUE_E)
+    clone = PiCreature(color=BLUE_E)
+    assert len(clone.fill_rgbas) > 0
+    assert len(clone.stroke_rgbas) > 0
+    assert clone.body is clone.submobjects[4]
+
+
+def test_transform_template_clone():
+    first = PiCreature(mode="plain", color=BLUE_E)
+    second = PiCreature(mode="happy", color=BLUE_E)
+    animation = Transform(second, first.copy().shift(RIGHT))
+    animation.begin()
+    animation.interpolate(0.5)
+    animation.finish()
+    assert np.allclose(second.get_center(), first.get_center() + RIGHT)
+
+
+def test_template_is_cached():
+    PiCreature(mode="plain", color=BLUE_E)
+    hits = PI_CREATURE_TEMPLATES.stats()["hits"]
+    PiCreature(mode="plain", color=BLUE_E)
+    assert PI_CREATURE_TEMPLATES.stats()["hits"] == hits + 1
+
+
+def test_flipped_creature_mirrors_the_pupil_dots():
+    pi = PiCreature().flip()
+    pi.look(RIGHT)
+    pupil = pi.pupils[0]
+    assert pupil.submobjects[0].get_center()[0] > pupil.get_center()[0]
@@ -0,0 +1,66 @@
+import numpy as np
+from manim import *
+
+from custom.characters.pi_creature import PiCreature
+from custom.characters.pi_creature_animations import EyeRows, Blink, CrowdBlink
+from custom.characters.pi_creature_scene import PiCreatureScene
+
+
+def test_eye_rows_close_and_release():
+    pi_creatures = [PiCreature(), PiCreature().shift(RIGHT)]
+    open_points = [np.array(part.points) for pi in pi_creatures for part in pi.eye_parts.family_members_with_points()]
+    eye_rows = EyeRows(pi_creatures)
+    eye_rows.close(np.array([1.0, 0.0]))
+    bottom = pi_creatures[0].eye_parts.get_bottom()[1]
+    assert np.allclose(pi_creatures[0].eyes[0].points[:, 1], bottom)
+    eye_rows.close(np.zeros(2))
+    eye_rows.release()
+    points = [part.points for pi in pi_creatures for part in pi.eye_parts.family_members_with_points()]
+    assert all(np.allclose(a, b) for a, b in zip(points, open_points))
+    assert all(part.points.base is None for part in eye_rows.parts)
+
+
+def test_blink_restores_the_eyes():
+    pi = PiCreature()
+    eye_points = np.array(pi.eyes[0].points)
+    animation = Blink(pi)
+    animation.begin()
+    animation.interpolate(0.5)
+    animation.finish()
+    assert np.allclose(pi.eyes[0].points, eye_points)
+
+
+def test_crowd_blink_defaults_to_linear():
+    assert CrowdBlink([PiCreature()]).rate_func is linear
+
+
+class TwoCreaturesScene(PiCreatureScene):
+    def create_pi_creatures(self):
+        return VGroup(PiCreature().to_edge(LEFT), PiCreature().to_edge(RIGHT))
+
+    def construct(self):
+        self.add(Square())
+        self.mobjects_before = list(self.mobjects)
+        self.play(CrowdBlink(self.pi_creatures), run_time=0.4)
+        self.mobjects_after = list(self.mobjects)
+
+
+def test_crowd_blink_keeps_the_scene_order(dry_run):
+    scene = TwoCreaturesScene(warm_up_modes=[])
+    scene.render()
+    assert scene.mobjects_after == scene.mobjects_before
+
+
+class GroupAnimationScene(PiCreatureScene):
+    def construct(self):
+        self.square = Square()
+        self.add(self.square)
+        self.group = Group(self.pi_creature, self.square)
+        self.play(Indicate(self.group), run_time=0.2)
+        self.mobjects_after = list(self.mobjects)
+
+
+def test_other_group_animations_are_added_as_usual(dry_run):
+    scene = GroupAnimationScene(warm_up_modes=[])
+    scene.render()
+    assert scene.mobjects_after[-1] is scene.group
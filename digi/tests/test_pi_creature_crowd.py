@@ -0,0 +1,46 @@
+import numpy as np
+from manim import *
+
+from custom.characters.pi_creature_crowd import PiCreatureCrowd
+
+
+def get_layout(crowd):
+    return [len(part.points) for part in crowd.submobjects]
+
+
+def test_mode_change_keeps_the_layout():
+    crowd = PiCreatureCrowd(np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0]]), colors=[BLUE, RED, BLUE])
+    layout = get_layout(crowd)
+    crowd.change_modes("happy", [1])
+    assert get_layout(crowd) == layout
+    crowd.change_modes(["sad", "plain", "hooray"])
+    assert get_layout(crowd) == layout
+
+
+def test_color_change_keeps_the_layout():
+    crowd = PiCreatureCrowd(np.array([[0, 0, 0], [1, 0, 0]]), colors=[BLUE, RED])
+    layout = get_layout(crowd)
+    crowd.set_colors(BLUE, [1]).refresh()
+    assert get_layout(crowd) == layout
+
+
+def test_animate_mode_change():
+    crowd = PiCreatureCrowd(np.array([[0, 0, 0], [1, 0, 0]]))
+    animation = crowd.animate.change_modes("happy").build()
+    animation.begin()
+    animation.interpolate(0.5)
+    animation.finish()
+    assert list(crowd.modes) == [crowd.mode_names.index("happy")] * 2
+
+
+def test_blink_frame_keeps_the_drawn_mobjects():
+    crowd = PiCreatureCrowd(np.array([[0, 0, 0], [1, 0, 0]]))
+    submobjects = list(crowd.submobjects)
+    eye_points = np.array(crowd.submobjects[-3].points)
+    animation = crowd.get_blink_animation()
+    animation.begin()
+    animation.interpolate(0.5)
+    assert all(a is b for a, b in zip(crowd.submobjects, submobjects))
+    assert len(crowd.submobjects) == len(submobjects)
+    assert not np.allclose(crowd.submobjects[-3].points, eye_points)
+    animation.finish()
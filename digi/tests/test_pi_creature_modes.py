@@ -0,0 +1,27 @@
+from manim import *
+
+from custom.characters.pi_creature import PiCreature, PI_CREATURE_TEMPLATES
+from custom.characters.pi_creature_modes import get_pi_creature_mode_index
+
+
+def test_all_modes_are_valid():
+    assert get_pi_creature_mode_index().validate_all() == {}
+
+
+def test_warm_up_uses_the_creature_style():
+    pi = PiCreature(color=RED)
+    get_pi_creature_mode_index().warm_up(["happy"], build_rig=False, **pi.get_style_kwargs())
+    hits = PI_CREATURE_TEMPLATES.stats()["hits"]
+    PiCreature(mode="happy", color=RED)
+    assert PI_CREATURE_TEMPLATES.stats()["hits"] == hits + 1
+
+
+def test_broken_layouts_are_reported():
+    index = get_pi_creature_mode_index()
+    pi = PiCreature()
+    pi.pupils[0].shift(2 * RIGHT)
+    pi.mouth.stretch(0, 1).shift(3 * DOWN)
+    problems = index.get_layout_problems(pi)
+    assert "pupil 2 is outside its eye" in problems
+    assert "part 5 is degenerate" in problems
+    assert "the mouth is outside the body" in problems
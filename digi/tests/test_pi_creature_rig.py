@@ -0,0 +1,35 @@
+import numpy as np
+from manim import *
+
+from custom.characters.pi_creature import PiCreature, get_pi_creature_rig
+
+
+def test_rig_pose_keeps_eyes_and_height():
+    pi = PiCreature().shift(2 * LEFT)
+    eyes_center = pi.eyes.get_center()
+    height = pi.get_height()
+    pi.change_mode("happy")
+    assert pi.get_mode() == "happy"
+    assert np.allclose(pi.eyes.get_center(), eyes_center, atol=1e-2)
+    assert np.isclose(pi.get_height(), height, rtol=1e-2)
+
+
+def test_blend_of_a_single_mode_is_its_pose():
+    rig = get_pi_creature_rig()
+    assert np.allclose(rig.blend({"happy": 1.0}), rig.base + rig.deltas[rig.mode_index["happy"]])
+    assert np.allclose(rig.blend({rig.base_mode: 1.0}), rig.base)
+
+
+def test_blend_modes():
+    pi = PiCreature()
+    pi.blend_modes({"plain": 0.3, "sad": 0.7})
+    assert pi.get_mode() == "sad"
+
+
+def test_animate_change_mode():
+    pi = PiCreature()
+    animation = pi.animate.change_mode("hooray").build()
+    animation.begin()
+    animation.interpolate(0.5)
+    animation.finish()
+    assert pi.get_mode() == "hooray"
@@ -0,0 +1,61 @@
+from manim import *
+
+from custom.characters.pi_creature import PiCreature
+from custom.characters.pi_creature_scene import PiCreatureScene
+
+
+def make_scene(**kwargs):
+    scene = PiCreatureScene(warm_up_modes=[], **kwargs)
+    scene.setup()
+    return scene
+
+
+def test_setup_puts_the_creature_on_screen():
+    scene = make_scene()
+    assert list(scene.get_on_screen_pi_creatures()) == [scene.pi_creature]
+
+
+def test_remove_and_add_track_the_creature():
+    scene = make_scene()
+    scene.remove(scene.pi_creature)
+    assert not scene.any_pi_creatures_on_screen()
+    scene.add(VGroup(scene.pi_creature))
+    assert scene.any_pi_creatures_on_screen()
+
+
+def test_play_tracks_the_creatures_it_adds_and_removes(dry_run):
+    scene = make_scene(pi_creatures_start_on_screen=False)
+    scene.play(FadeIn(VGroup(scene.pi_creature)), run_time=0.2)
+    assert scene.any_pi_creatures_on_screen()
+    scene.play(FadeOut(scene.pi_creature), run_time=0.2)
+    assert not scene.any_pi_creatures_on_screen()
+
+
+def test_rescan_finds_a_creature_put_into_a_group():
+    scene = make_scene(pi_creatures_start_on_screen=False)
+    group = VGroup(Square())
+    scene.add(group)
+    group.add(scene.pi_creature)
+    scene.rescan_on_screen_pi_creatures()
+    assert scene.any_pi_creatures_on_screen()
+
+
+def test_bring_to_back_keeps_the_creatures():
+    scene = make_scene()
+    square = Square()
+    scene.add(square)
+    scene.bring_to_back(square)
+    assert scene.pi_creature in scene.get_on_screen_pi_creatures()
+
+
+def test_scene_random_is_reproducible():
+    first = make_scene(random_seed=3).scene_random
+    second = make_scene(random_seed=3).scene_random
+    assert first.choice(range(100), "blink") == second.choice(range(100), "blink")
+
+
+def test_new_parts_are_related_to_their_creature():
+    scene = make_scene()
+    scene.pi_creature.change_mode("happy")
+    assert scene.get_related_pi_creatures(scene.pi_creature.mouth) == {scene.pi_creature}
+    assert scene.get_related_pi_creatures(Square()) == frozenset()
@@ -0,0 +1,28 @@
+import json
+
+from custom.utils import SceneRandom
+
+
+def test_seed_follows_the_scene_name():
+    assert SceneRandom("A").seed == SceneRandom("A").seed
+    assert SceneRandom("A").seed != SceneRandom("B").seed
+    assert SceneRandom("A", 7).seed == 7
+
+
+def test_same_seed_draws_the_same_numbers():
+    first, second = SceneRandom("A"), SceneRandom("A")
+    assert first.shuffle(list(range(20)), "blink") == second.shuffle(list(range(20)), "blink")
+    assert first.random(stream="hands") == second.random(stream="hands")
+
+
+def test_streams_are_independent():
+    first, second = SceneRandom("A"), SceneRandom("A")
+    first.random(10, stream="other")
+    assert first.choice(range(100), "blink") == second.choice(range(100), "blink")
+
+
+def test_save(tmp_path):
+    scene_random = SceneRandom("A", 3)
+    scene_random.random(stream="blink")
+    scene_random.save(str(tmp_path / "seed.json"))
+    assert json.loads((tmp_path / "seed.json").read_text()) == {"seed": 3, "streams": ["blink"]}
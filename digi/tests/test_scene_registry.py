@@ -0,0 +1,45 @@
+from manim import *
+
+from custom.scene_registry import SceneRegistry, SCENE_REGISTRY
+from custom.characters.pi_creature_scene import PiCreatureScene
+
+
+class SquareScene(Scene):
+    def construct(self):
+        self.add(Square())
+
+
+class ShortPiCreatureScene(PiCreatureScene):
+    def construct(self):
+        self.play(self.pi_creature.animate.change_mode("happy"), run_time=0.2)
+
+
+def test_register_and_render(dry_run):
+    registry = SceneRegistry()
+    assert registry.register(SquareScene) is SquareScene
+    registry.render("SquareScene")
+    assert "SquareScene" in registry.render_times
+    assert registry.current is None
+
+
+def test_pi_creature_scenes_render_twice(dry_run):
+    # The second render starts from the shared caches the first one filled
+    for _ in range(2):
+        scene = ShortPiCreatureScene(warm_up_modes=[])
+        scene.render()
+        assert SCENE_REGISTRY.current is None
+        assert scene.mobjects == []
+
+
+def test_begin_refuses_a_second_scene():
+    registry = SceneRegistry()
+    first, second = SquareScene(), SquareScene()
+    registry.begin(first)
+    try:
+        registry.begin(second)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("a second scene began while the first one was rendered")
+    finally:
+        registry.end(first)
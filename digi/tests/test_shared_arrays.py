@@ -0,0 +1,65 @@
+import numpy as np
+from manim import *
+
+from custom.shared_arrays import SharedArray, copy_on_write, share_buffer
+
+
+def test_copy_shares_the_buffers():
+    square = VGroup(Square())
+    clone = copy_on_write(square)
+    assert isinstance(clone[0].points, SharedArray)
+    assert np.shares_memory(clone[0].points, square[0].points)
+
+
+def test_item_assignment_gives_a_private_copy():
+    square = VGroup(Square())
+    points = np.array(square[0].points)
+    clone = copy_on_write(square)
+    clone[0].points[0] = [5, 5, 0]
+    assert np.allclose(square[0].points, points)
+    assert np.allclose(clone[0].points[0], [5, 5, 0])
+    assert not np.shares_memory(clone[0].points, square[0].points)
+
+
+def test_in_place_operation_gives_a_private_copy():
+    square = VGroup(Square())
+    points = np.array(square[0].points)
+    clone = copy_on_write(square)
+    clone[0].points += RIGHT
+    assert np.allclose(square[0].points, points)
+    assert np.allclose(clone[0].points, points + RIGHT)
+
+
+def test_manim_methods_leave_the_original_alone():
+    square = VGroup(Square())
+    points = np.array(square[0].points)
+    clone = copy_on_write(square)
+    clone.shift(UP).set_fill(RED, opacity=1)
+    assert np.allclose(square[0].points, points)
+    assert np.allclose(clone[0].get_center(), UP)
+
+
+def test_share_buffer():
+    dots = [VMobject(), VMobject()]
+    share_buffer(Square().points, dots, "points")
+    assert np.shares_memory(dots[0].points, dots[1].points)
+    dots[0].points[0] = [9, 9, 0]
+    assert not np.allclose(dots[1].points[0], [9, 9, 0])
+
+
+def test_reversed_copy_can_be_transformed():
+    square = VGroup(Square())
+    points = np.array(square[0].points)
+    clone = copy_on_write(square)
+    clone[0].reverse_direction()
+    clone[0].scale(2).rotate(PI / 3).stretch(2, 0).flip()
+    assert np.allclose(square[0].points, points)
+
+
+def test_slice_writes_give_a_private_copy():
+    square = VGroup(Square())
+    points = np.array(square[0].points)
+    clone = copy_on_write(square)
+    clone[0].points[:, 1] *= 2
+    assert np.allclose(square[0].points, points)
+    assert np.allclose(clone[0].points[:, 1], 2 * points[:, 1])
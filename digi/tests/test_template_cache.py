@@ -0,0 +1,34 @@
+from manim import *
+
+from custom.utils import TemplateCache, freeze
+
+
+def test_get_and_put():
+    cache = TemplateCache(max_size=2)
+    assert cache.get("a") is None
+    square = Square()
+    assert cache.put("a", square) is square
+    assert cache.get("a") is square
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_is_evicted():
+    cache = TemplateCache(max_size=2)
+    cache.put("a", Square())
+    cache.put("b", Square())
+    cache.get("a")
+    cache.put("c", Square())
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+
+def test_byte_bound():
+    cache = TemplateCache(max_size=10, max_bytes=1)
+    cache.put("a", Square())
+    cache.put("b", Square())
+    # The last template is kept whatever its size
+    assert len(cache) == 1 and "b" in cache
+
+
+def test_freeze_is_hashable_and_order_free():
+    assert freeze({"a": [1, 2], "b": {"c": 3}}) == freeze({"b": {"c": 3}, "a": [1, 2]})
+    hash(freeze({"a": [1, 2]}))